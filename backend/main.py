@@ -1,44 +1,70 @@
 import os
+import re
 import sys
+import asyncio
 import subprocess
-import json
+import time
+import orjson
+import threading
 import certifi
 import httpx
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from fastapi import FastAPI, HTTPException, Depends, Header
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse, JSONResponse
-from fastapi.staticfiles import StaticFiles
-from motor.motor_asyncio import AsyncIOMotorClient
+from fastapi.responses import RedirectResponse, ORJSONResponse
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+from pymongo import ReturnDocument
 from pydantic import BaseModel
 from dotenv import load_dotenv
 from models.project import ProjectCreate
 import uuid
 from jose import jwt
+from backboard import BackboardClient
 from pathlib import Path
+from urllib.parse import urlencode
 
 
 load_dotenv()
 
+from translation import GithubFetchPythonValt2, filtering, translation
+
+
+# Verified tokens -> (username, exp), so repeat requests skip the HMAC check.
+# get_current_user runs in the threadpool, so every access goes through the lock.
+_verified_tokens = TTLCache(maxsize=4096, ttl=60)
+_verified_tokens_lock = threading.Lock()
+
 
 def get_current_user(authorization: str = Header(None)) -> str:
     """Extract username from JWT token in Authorization header"""
     if not authorization:
         raise HTTPException(status_code=401, detail="Missing authorization header")
+    if authorization[:7].lower() != "bearer ":
+        raise HTTPException(status_code=401, detail="Invalid authorization header format")
+    token = authorization[7:]
     
     try:
-        scheme, token = authorization.split()
-        if scheme.lower() != "bearer":
-            raise HTTPException(status_code=401, detail="Invalid authorization scheme")
+        with _verified_tokens_lock:
+            cached = _verified_tokens.get(token)
+            expired = cached is not None and cached[1] <= time.time()
+            if expired:
+                _verified_tokens.pop(token, None)
+        if expired:
+            raise HTTPException(status_code=401, detail="Token expired")
+        if cached:
+            return cached[0]
         
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         username = payload.get("username")
         if not username:
             raise HTTPException(status_code=401, detail="Invalid token")
+        if "exp" in payload:
+            with _verified_tokens_lock:
+                _verified_tokens[token] = (username, payload["exp"])
         return username
-    except ValueError:
-        raise HTTPException(status_code=401, detail="Invalid authorization header format")
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired")
     except jwt.InvalidTokenError:
@@ -69,15 +95,39 @@ async def lifespan(app: FastAPI):
     app.mongodb_client = AsyncIOMotorClient(
         uri, 
         tlsCAFile=ca,
-        tlsAllowInvalidCertificates=True)
+        tlsAllowInvalidCertificates=True,
+        maxPoolSize=50,
+        minPoolSize=5,
+        maxIdleTimeMS=60000,
+        serverSelectionTimeoutMS=3000,
+        waitQueueTimeoutMS=3000,
+        retryWrites=True,
+        compressors="zstd,zlib")
     app.mongodb = app.mongodb_client.divergence
     app.users_collection = app.mongodb.users
     app.projects_collection = app.mongodb.projects
     app.github_data_collection = app.mongodb.github_data  # Store translated.json here
+    # Long-lived clients so GitHub/Backboard connections are reused across requests
+    app.http = httpx.AsyncClient(
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=20))
+    app.backboard = BackboardClient(api_key=BACKBOARD_API_KEY)
+    # Shared, bounded pool for pipeline runs: concurrent logins queue instead of
+    # piling up clones/regex scans, and the stage modules stay imported between runs
+    app.pipeline_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pipeline")
+    # Independent round trips, so run them concurrently: max(RTT) instead of sum(RTT)
+    await asyncio.gather(
+        app.mongodb_client.admin.command('ping'),
+        app.users_collection.create_index("username", unique=True),
+        app.users_collection.create_index("github_id", unique=True),
+        app.projects_collection.create_index("project_id", unique=True),
+    )
     print("Connected to MongoDB!")
 
     yield
 
+    await app.http.aclose()
+    app.pipeline_executor.shutdown(wait=False)
     app.mongodb_client.close()
     print("Disconnected from MongoDB")
 
@@ -95,6 +145,27 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Shared resources set up in lifespan, injected into endpoints via Depends
+def get_users_collection() -> AsyncIOMotorCollection:
+    return app.users_collection
+
+
+def get_projects_collection() -> AsyncIOMotorCollection:
+    return app.projects_collection
+
+
+def get_github_data_collection() -> AsyncIOMotorCollection:
+    return app.github_data_collection
+
+
+def get_http_client() -> httpx.AsyncClient:
+    return app.http
+
+
+def get_backboard_client() -> BackboardClient:
+    return app.backboard
+
+
 """
 # Health check
 @app.get("/")
@@ -119,11 +190,9 @@ async def health_check():
    }
 
 @app.post('/api/projects')
-async def create_project(project: ProjectCreate):
+async def create_project(project: ProjectCreate,
+                         projects_collection: AsyncIOMotorCollection = Depends(get_projects_collection)):
     try:
-        
-        projects_collection = app.mongodb.projects
-        
         project_id = str(uuid.uuid4())
 
         project_data = {
@@ -151,11 +220,9 @@ async def create_project(project: ProjectCreate):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/projects/{project_id}")
-async def get_project(project_id: str):
-   if not hasattr(app, 'projects_collection'):
-       raise HTTPException(status_code=500, detail="Database not connected")
-  
-   project = await app.projects_collection.find_one({"id": project_id})
+async def get_project(project_id: str,
+                      projects_collection: AsyncIOMotorCollection = Depends(get_projects_collection)):
+   project = await projects_collection.find_one({"project_id": project_id})
    if not project:
        raise HTTPException(status_code=404, detail="Project not found")
   
@@ -163,12 +230,15 @@ async def get_project(project_id: str):
    return project
 
 
+# Fields returned by the project listing (keeps future document fields off the wire)
+PROJECT_LIST_FIELDS = {
+    "_id": 0, "project_id": 1, "name": 1, "goal": 1, "dueDate": 1,
+    "mode": 1, "teamMembers": 1, "repoOption": 1, "existingRepoUrl": 1
+}
+
 @app.get("/api/projects")
-async def list_projects():
-   if not hasattr(app, 'projects_collection'):
-       raise HTTPException(status_code=500, detail="Database not connected")
-  
-   projects = await app.projects_collection.find({}, {"_id": 0}).to_list(length=100)
+async def list_projects(projects_collection: AsyncIOMotorCollection = Depends(get_projects_collection)):
+   projects = await projects_collection.find({}, PROJECT_LIST_FIELDS).to_list(length=100)
    return {"projects": projects, "count": len(projects)}
 
 
@@ -176,43 +246,52 @@ async def list_projects():
 
 
 # GitHub OAuth
+# Encoded tokens reused for a burst of logins by the same user (exp shifts by at most 15 s)
+_issued_tokens = TTLCache(maxsize=1024, ttl=15)
+
+
 def create_access_token(data: dict, expires_delta: timedelta = None):
+   key = (frozenset(data.items()), expires_delta)
+   token = _issued_tokens.get(key)
+   if token:
+       return token
    to_encode = data.copy()
-   expire = datetime.utcnow() + (expires_delta or timedelta(minutes=15))
+   expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=15))
    to_encode.update({"exp": expire})
-   return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-
-
-async def get_github_user(code: str):
-   async with httpx.AsyncClient() as client:
-       token_response = await client.post(
-           GITHUB_TOKEN_URL,
-           data={
-               "client_id": GITHUB_CLIENT_ID,
-               "client_secret": GITHUB_CLIENT_SECRET,
-               "code": code,
-           },
-           headers={"Accept": "application/json"}
-       )
+   token = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+   _issued_tokens[key] = token
+   return token
+
+
+async def get_github_user(code: str, client: httpx.AsyncClient):
+   token_response = await client.post(
+       GITHUB_TOKEN_URL,
+       data={
+           "client_id": GITHUB_CLIENT_ID,
+           "client_secret": GITHUB_CLIENT_SECRET,
+           "code": code,
+       },
+       headers={"Accept": "application/json"}
+   )
       
-       if token_response.status_code != 200:
-           raise HTTPException(status_code=400, detail="Failed to get token")
+   if token_response.status_code != 200:
+       raise HTTPException(status_code=400, detail="Failed to get token")
       
-       token_data = token_response.json()
-       access_token = token_data.get("access_token")
+   token_data = token_response.json()
+   access_token = token_data.get("access_token")
       
-       if not access_token:
-           raise HTTPException(status_code=400, detail="No access token")
+   if not access_token:
+       raise HTTPException(status_code=400, detail="No access token")
       
-       user_response = await client.get(
-           GITHUB_USER_URL,
-           headers={"Authorization": f"Bearer {access_token}", "Accept": "application/json"}
-       )
+   user_response = await client.get(
+       GITHUB_USER_URL,
+       headers={"Authorization": f"Bearer {access_token}", "Accept": "application/json"}
+   )
       
-       if user_response.status_code != 200:
-           raise HTTPException(status_code=400, detail="Failed to get user")
+   if user_response.status_code != 200:
+       raise HTTPException(status_code=400, detail="Failed to get user")
       
-       return user_response.json()
+   return user_response.json()
 
 
 @app.get("/auth/github")
@@ -223,35 +302,37 @@ def github_login():
        "scope": "user:email",
        "state": "random-state"
    }
-   query_string = "&".join([f"{k}={v}" for k, v in params.items()])
+   query_string = urlencode(params)
    return RedirectResponse(url=f"{GITHUB_AUTHORIZE_URL}?{query_string}")
 
 
 @app.get("/auth/github/callback")
-async def github_callback(code: str, state: str = None):
+async def github_callback(code: str, state: str = None,
+                          users_collection: AsyncIOMotorCollection = Depends(get_users_collection),
+                          github_data_collection: AsyncIOMotorCollection = Depends(get_github_data_collection),
+                          http_client: httpx.AsyncClient = Depends(get_http_client)):
    if not code:
        raise HTTPException(status_code=400, detail="Missing code")
   
    try:
-       github_user = await get_github_user(code)
-       user = await app.users_collection.find_one({"github_id": github_user["id"]})
-      
-       if not user:
-           user_data = {
-               "github_id": github_user["id"],
-               "username": github_user["login"],
-               "email": github_user.get("email"),
-               "avatar_url": github_user.get("avatar_url"),
-               "created_at": datetime.utcnow()
-           }
-           result = await app.users_collection.insert_one(user_data)
-           user_data["_id"] = result.inserted_id
-           user = user_data
-       else:
-           await app.users_collection.update_one(
-               {"github_id": github_user["id"]},
-               {"$set": {"last_login": datetime.utcnow()}}
-           )
+       github_user = await get_github_user(code, http_client)
+       # Single atomic round trip: create the user on first login, always bump last_login
+       now = datetime.now(timezone.utc)
+       user = await users_collection.find_one_and_update(
+           {"github_id": github_user["id"]},
+           {
+               "$setOnInsert": {
+                   "username": github_user["login"],
+                   "email": github_user.get("email"),
+                   "avatar_url": github_user.get("avatar_url"),
+                   "created_at": now
+               },
+               "$set": {"last_login": now}
+           },
+           projection={"_id": 1, "username": 1},
+           upsert=True,
+           return_document=ReturnDocument.AFTER
+       )
       
        access_token = create_access_token(
            data={"username": user["username"]},
@@ -261,7 +342,7 @@ async def github_callback(code: str, state: str = None):
        # Auto-process GitHub data if not already processed
        username = user["username"]
        user_id = str(user["_id"])
-       await check_and_process_user_data(username, user_id)
+       await check_and_process_user_data(username, user_id, users_collection, github_data_collection)
       
        # Redirect to frontend with token, username, and user_id in URL
        frontend_url = f"http://localhost:3000/home?token={access_token}&username={username}&user_id={user_id}"
@@ -271,11 +352,13 @@ async def github_callback(code: str, state: str = None):
        raise HTTPException(status_code=400, detail=str(e))
 
 
-async def check_and_process_user_data(username: str, user_id: str):
+async def check_and_process_user_data(username: str, user_id: str,
+                                      users_collection: AsyncIOMotorCollection,
+                                      github_data_collection: AsyncIOMotorCollection):
     """Check if user data has been processed, if not trigger processing using process_github_user_main"""
     try:
         # Check if user already has processed data
-        user = await app.users_collection.find_one({"username": username})
+        user = await users_collection.find_one({"username": username}, {"github_processed": 1, "processed_at": 1})
         
         # Check if they have been processed before (flag in MongoDB)
         if user and user.get("github_processed"):
@@ -302,7 +385,7 @@ async def check_and_process_user_data(username: str, user_id: str):
             
             if file_age_days < 1:
                 # File exists and is fresh, mark as processed in DB
-                await app.users_collection.update_one(
+                await users_collection.update_one(
                     {"username": username},
                     {"$set": {"github_processed": True, "processed_at": datetime.utcnow()}}
                 )
@@ -314,16 +397,14 @@ async def check_and_process_user_data(username: str, user_id: str):
         # Not processed or data is stale - run process_github_user_main to fetch and process data
         print(f"Processing GitHub data for user: {username} (ID: {user_id})")
         try:
-            process_github_user_main(username, user_id)
+            await run_pipeline(username, user_id)
+            _invalidate_responses(username)
             
             # After processing, store translated data in MongoDB
-            user_translated_file = Path(__file__).parent / "translation" / user_id / "translated.json"
-            if user_translated_file.exists():
-                with open(user_translated_file, 'r', encoding='utf-8') as f:
-                    translated_data = json.load(f)
-                
+            translated_data = _get_pipeline_output(user_id, "translated")
+            if translated_data is not None:
                 # Store in MongoDB
-                await app.github_data_collection.update_one(
+                await github_data_collection.update_one(
                     {"user_id": user_id, "username": username},
                     {"$set": {
                         "user_id": user_id,
@@ -336,7 +417,7 @@ async def check_and_process_user_data(username: str, user_id: str):
                 print(f"✓ Stored translated data in MongoDB for {username}")
             
             # Mark as processed
-            await app.users_collection.update_one(
+            await users_collection.update_one(
                 {"username": username},
                 {"$set": {"github_processed": True, "processed_at": datetime.utcnow()}}
             )
@@ -352,10 +433,51 @@ async def check_and_process_user_data(username: str, user_id: str):
 
 # Translation    =================================================================
 
+# Per-user pipeline output ({user_id: {"filtered": ..., "translated": ...}}) so the
+# GET endpoints don't re-read the JSON files; written from the pipeline worker thread
+_pipeline_cache = TTLCache(maxsize=1024, ttl=3600)
+_pipeline_cache_lock = threading.Lock()
+
+
+# Whole-pipeline budget in seconds: the old per-stage subprocess timeouts summed
+# (fetch 120 + filter 60 + translate 60 + modelling 60)
+PIPELINE_TIMEOUT = 300
+
+
+async def run_pipeline(github_username: str, user_id: str):
+    loop = asyncio.get_running_loop()
+    return await asyncio.wait_for(
+        loop.run_in_executor(app.pipeline_executor, process_github_user_main, github_username, user_id),
+        timeout=PIPELINE_TIMEOUT)
+
+
+# Assembled /get-*-data responses keyed by (kind, github_username, user_id query param);
+# skips the Mongo lookup and patch-up on repeat reads. Only touched from the event loop.
+# Values are the patched per-request copies, never objects held in _pipeline_cache.
+_response_cache = TTLCache(maxsize=1024, ttl=300)
+
+
+def _invalidate_responses(github_username: str):
+    for key in [k for k in _response_cache if k[1] == github_username]:
+        _response_cache.pop(key, None)
+
+
+def _get_pipeline_output(user_id: str, kind: str):
+    with _pipeline_cache_lock:
+        return _pipeline_cache.get(user_id, {}).get(kind)
+
+
+def _set_pipeline_output(user_id: str, kind: str, data):
+    with _pipeline_cache_lock:
+        entry = _pipeline_cache.get(user_id, {})
+        entry[kind] = data
+        _pipeline_cache[user_id] = entry
+
 
 # Process GitHub user data endpoint
 @app.post("/process-github/{github_username}")
-async def process_github_user(github_username: str, current_user: str = Depends(get_current_user)):
+async def process_github_user(github_username: str, current_user: str = Depends(get_current_user),
+                              users_collection: AsyncIOMotorCollection = Depends(get_users_collection)):
     """Process GitHub user data - only if logged in as that user"""
 
     # Only allow processing if logged in as that user
@@ -364,14 +486,16 @@ async def process_github_user(github_username: str, current_user: str = Depends(
     
     try:
         # Get user_id from MongoDB
-        user = await app.users_collection.find_one({"username": github_username})
+        user = await users_collection.find_one({"username": github_username}, {"_id": 1})
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
         
         user_id = str(user["_id"])
-        return process_github_user_main(github_username, user_id)
+        result = await run_pipeline(github_username, user_id)
+        _invalidate_responses(github_username)
+        return result
         
-    except subprocess.TimeoutExpired:
+    except (asyncio.TimeoutError, subprocess.TimeoutExpired):
         raise HTTPException(status_code=408, detail="Processing timeout - operation took too long")
     except Exception as e:
         print(f"Processing error: {str(e)}")
@@ -401,64 +525,41 @@ def process_github_user_main(github_username, user_id):
     print(f"Using user directory: {user_dir}")
     # same as os.path.join(os.path.dirname(__file__), "translation")
 
-    # Step 1: Run GithubFetchPythonValt2.py
+    # Step 1: GithubFetchPythonValt2
     print("Step 1: Fetching GitHub repositories...")
-    github_fetch_python_valt2 = translation_dir / "GithubFetchPythonValt2.py"
-    
     username_url = f"https://github.com/{github_username}"
     
     # RESULTS.txt goes in user-specific directory
     results_file = user_dir / "RESULTS.txt"
     
-    result1 = subprocess.run(
-        #argument order: [smthn] [filename] [args...]
-        [sys.executable, str(github_fetch_python_valt2), username_url, str(results_file)],
-        capture_output=True,
-        text=True,
-        cwd=str(translation_dir),
-        timeout=120
-    )
-    
-    if result1.returncode != 0:
-        print(f"GithubFetch error: {result1.stderr}")
-        raise HTTPException(status_code=400, detail=f"GitHub fetch failed: {result1.stderr}")
+    try:
+        GithubFetchPythonValt2.run(username_url, str(results_file))
+    except Exception as e:
+        print(f"GithubFetch error: {e}")
+        raise HTTPException(status_code=400, detail=f"GitHub fetch failed: {e}")
     
     print("✓ GitHub repositories fetched successfully")
     
-    # Step 2: Run filtering.py
+    # Step 2: filtering
     print("Step 2: Filtering and cleaning data...")
-    filtering_script = translation_dir / "filtering.py"
-    
-    result2 = subprocess.run(   
-        [sys.executable, str(filtering_script), str(results_file), str(user_dir)],
-        capture_output=True,
-        text=True,
-        cwd=str(translation_dir),
-        timeout=60
-    )
-    
-    if result2.returncode != 0:
-        print(f"Filtering error: {result2.stderr}")
-        raise HTTPException(status_code=400, detail=f"Filtering failed: {result2.stderr}")
+    try:
+        filtered_data = filtering.run(results_file, user_dir)
+    except Exception as e:
+        print(f"Filtering error: {e}")
+        raise HTTPException(status_code=400, detail=f"Filtering failed: {e}")
     
     print("✓ Data filtered successfully")
     
-    # Step 3: Run translation.py
+    # Step 3: translation (filtered data handed over in memory)
     print("Step 3: Translating to developer profile...")
-    translation_script = translation_dir / "translation.py"
-    filtered_json_file = user_dir / "filtered.json"
-    
-    result3 = subprocess.run(
-        [sys.executable, str(translation_script), str(filtered_json_file), str(user_dir)],
-        capture_output=True,
-        text=True,
-        cwd=str(translation_dir),
-        timeout=60
-    )
+    try:
+        translated_data = translation.run(filtered_data, user_dir)
+    except Exception as e:
+        print(f"Translation error: {e}")
+        raise HTTPException(status_code=400, detail=f"Translation failed: {e}")
     
-    if result3.returncode != 0:
-        print(f"Translation error: {result3.stderr}")
-        raise HTTPException(status_code=400, detail=f"Translation failed: {result3.stderr}")
+    _set_pipeline_output(user_id, "filtered", filtered_data)
+    _set_pipeline_output(user_id, "translated", translated_data)
      
     # Step 4: Run modelling.py
     print("Step 4: Running modelling script...")
@@ -476,30 +577,14 @@ def process_github_user_main(github_username, user_id):
 
     print("✓ Developer profile translated successfully")
     
-    # Load the results from user-specific directory
-    filtered_file = user_dir / "filtered.json"
-    translated_file = user_dir / "translated.json"
-    
-    filtered_data = None
-    translated_data = None
-    
-
-    if filtered_file.exists():
-        with open(filtered_file, 'r') as f:
-            filtered_data = json.load(f)
-    
-    if translated_file.exists():
-        with open(translated_file, 'r') as f:
-            translated_data = json.load(f)
-    
     # Store in MongoDB as 'user_github_results' collection
     # Note: This is a sync function, MongoDB operations removed to avoid blocking
     # Consider making this async or moving DB operations to the async caller
     
     print(" DONE DONE DONE DONE DONE DONE DONE DONE DONE DONE DONE DONE DONE DONE DONE DONE")
-    print("Translated FILE:",translated_file)
+    print("Translated FILE:",translated_json_file)
 
-    return JSONResponse({
+    return ORJSONResponse({
         "status": "success",
         "message": f"Successfully processed {github_username}",
         "github_username": github_username,
@@ -508,14 +593,20 @@ def process_github_user_main(github_username, user_id):
 
 
 @app.get("/get-filtered-data/{github_username}")
-async def get_filtered_data(github_username: str, user_id: str = None, current_user: str = Depends(get_current_user)):
+async def get_filtered_data(github_username: str, user_id: str = None, current_user: str = Depends(get_current_user),
+                            users_collection: AsyncIOMotorCollection = Depends(get_users_collection)):
     """Get filtered data for a GitHub user - reads from user-specific filtered.json"""
     
     if current_user != github_username:
         raise HTTPException(status_code=403, detail="You can only access your own data")
     
+    cache_key = ("filtered", github_username, user_id)
+    cached = _response_cache.get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+    
     # Get user from MongoDB to get user_id if not provided
-    user = await app.users_collection.find_one({"username": github_username})
+    user = await users_collection.find_one({"username": github_username}, {"username": 1, "avatar_url": 1})
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
@@ -523,19 +614,21 @@ async def get_filtered_data(github_username: str, user_id: str = None, current_u
     if not user_id:
         user_id = str(user["_id"])
     
-    # Look in the user-specific directory
+    # Serve from the pipeline cache, falling back to the user-specific directory
+    filtered_data = _get_pipeline_output(user_id, "filtered")
     filtered_file = Path(__file__).parent / "translation" / user_id / "filtered.json"
     
-    if not filtered_file.exists():
+    if filtered_data is None and not filtered_file.exists():
         raise HTTPException(status_code=404, detail="No filtered data found for this user")
     
     try:
-        with open(filtered_file, 'r', encoding='utf-8') as f:
-            filtered_data = json.load(f)
+        if filtered_data is None:
+            with open(filtered_file, 'rb') as f:
+                filtered_data = orjson.loads(f.read())
+            _set_pipeline_output(user_id, "filtered", filtered_data)
         
-        # Ensure the data has the expected structure for the frontend
-        if not filtered_data.get("profile"):
-            filtered_data["profile"] = {}
+        # Patch a copy: the cached pipeline output is shared by every request for this user
+        filtered_data = {**filtered_data, "profile": {**(filtered_data.get("profile") or {})}}
         
         # Fill in profile data from MongoDB if available
         if user:
@@ -557,35 +650,42 @@ async def get_filtered_data(github_username: str, user_id: str = None, current_u
         if "recentWorks" not in filtered_data:
             filtered_data["recentWorks"] = []
         
-        return JSONResponse(filtered_data)
-    except json.JSONDecodeError as e:
+        _response_cache[cache_key] = filtered_data
+        return ORJSONResponse(filtered_data)
+    except orjson.JSONDecodeError as e:
         raise HTTPException(status_code=500, detail=f"Invalid JSON in filtered file: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error reading filtered data: {str(e)}")
 
 
 @app.get("/auth/github/user")
-async def get_current_github_user(current_user: str = Depends(get_current_user)):
+async def get_current_github_user(current_user: str = Depends(get_current_user),
+                                  users_collection: AsyncIOMotorCollection = Depends(get_users_collection)):
     """Get current authenticated user's GitHub profile from MongoDB"""
     
-    user = await app.users_collection.find_one({"username": current_user})
+    user = await users_collection.find_one({"username": current_user}, {"_id": 0, "username": 1, "email": 1, "avatar_url": 1})
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    # Remove MongoDB _id field
-    user.pop("_id", None)
-    return JSONResponse(user)
+    return ORJSONResponse(user)
 
 
 @app.get("/get-translated-data/{github_username}")
-async def get_translated_data(github_username: str, user_id: str = None, current_user: str = Depends(get_current_user)):
+async def get_translated_data(github_username: str, user_id: str = None, current_user: str = Depends(get_current_user),
+                              users_collection: AsyncIOMotorCollection = Depends(get_users_collection),
+                              github_data_collection: AsyncIOMotorCollection = Depends(get_github_data_collection)):
     """Get translated profile data for a GitHub user - reads from user-specific translated.json or MongoDB"""
     
     if current_user != github_username:
         raise HTTPException(status_code=403, detail="You can only access your own data")
     
+    cache_key = ("translated", github_username, user_id)
+    cached = _response_cache.get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+    
     # Get user from MongoDB to get user_id if not provided
-    user = await app.users_collection.find_one({"username": github_username})
+    user = await users_collection.find_one({"username": github_username}, {"username": 1, "avatar_url": 1})
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
@@ -593,31 +693,30 @@ async def get_translated_data(github_username: str, user_id: str = None, current
     if not user_id:
         user_id = str(user["_id"])
     
-    # First try to read from file (fastest)
+    # First try the pipeline cache, then the file
+    translated_data = _get_pipeline_output(user_id, "translated")
     translated_file = Path(__file__).parent / "translation" / user_id / "translated.json"
     
-    if translated_file.exists():
+    if translated_data is None and translated_file.exists():
         try:
-            with open(translated_file, 'r', encoding='utf-8') as f:
-                translated_data = json.load(f)
+            with open(translated_file, 'rb') as f:
+                translated_data = orjson.loads(f.read())
+            _set_pipeline_output(user_id, "translated", translated_data)
         except Exception as e:
             print(f"Error reading file, trying MongoDB: {e}")
             translated_data = None
-    else:
-        translated_data = None
     
     # Fallback to MongoDB if file doesn't exist or failed to read
     if not translated_data:
         print(f"File not found, reading from MongoDB for {github_username}")
-        mongo_data = await app.github_data_collection.find_one({"user_id": user_id})
+        mongo_data = await github_data_collection.find_one({"user_id": user_id}, {"translated_data": 1})
         if mongo_data and "translated_data" in mongo_data:
             translated_data = mongo_data["translated_data"]
         else:
             raise HTTPException(status_code=404, detail="No translated data found for this user")
     
-    # Ensure the data has the expected structure
-    if not translated_data.get("profile"):
-        translated_data["profile"] = {}
+    # Patch a copy: the cached pipeline output is shared by every request for this user
+    translated_data = {**translated_data, "profile": {**(translated_data.get("profile") or {})}}
     
     # Fill in profile data from MongoDB if missing
     if user:
@@ -636,25 +735,27 @@ async def get_translated_data(github_username: str, user_id: str = None, current
     if "libraries" not in translated_data:
         translated_data["libraries"] = []
     
-    return JSONResponse(translated_data)
+    _response_cache[cache_key] = translated_data
+    return ORJSONResponse(translated_data)
 
 
 # =================== BACKBOARDIO ========================== #
-import requests
-from backboard import BackboardClient
 
 BACKBOARD_API_KEY = os.getenv('BACKBOARD_KEY')
 BACKBOARD_BASE_URL = "https://app.backboard.io/api"
 BACKBOARD_HEADERS = {"X-API-Key": BACKBOARD_API_KEY}
 
+# Strips ```json fences the model sometimes wraps its JSON reply in
+_FENCE_RE = re.compile(r'```json?\n?|\n?```')
+
 SCOPING_SYSTEM_PROMPT = "You are an expert Product Manager conducting a project scoping interview. Your goal is to understand what the user wants to build through conversational questions. Your responsibilities are: (1) Ask clarifying questions to understand what problem this solves, who the users or target audience are, what the core features are (must-have vs nice-to-have), the technical complexity, any constraints such as timeline, budget, or existing tech stack, and the success criteria. (2) After each user response, assess your understanding by evaluating whether you understand the problem clearly, know who the users are, know what needs to be built, understand the constraints, and can confidently create a project breakdown. (3) Calculate confidence on a scale from 0 to 1 where 0–0.2 means just starting and needing basic info, 0.2–0.4 means understanding the problem but needing features or users, 0.4–0.6 means knowing what to build but needing technical details, 0.6–0.8 means good understanding with edge cases remaining, and 0.8–1.0 means fully understood and ready for breakdown. (4) Know when to stop: stop at 0.85 confidence or higher, stop after a maximum of 8 questions, and if the user provides comprehensive answers, increase confidence significantly. You must respond with ONLY valid JSON in this exact structure: {{ 'question': 'Your next clarifying question here or Ready to proceed! if confidence is at least 0.85', 'confidence': 0.75, 'reasoning': 'Brief explanation of current understanding and what is still needed', 'understood_so_far': {{ 'problem': 'What problem this solves', 'users': 'Who will use this', 'features': ['list','of','key','features'], 'constraints': ['any','known','constraints'] }} }}. Ask exactly one question at a time, be conversational and friendly, never repeat a question, increase confidence appropriately when the user provides detail, prefer breadth over depth early, and if confidence is at least 0.85, set the question field to Ready to proceed!. Return only the JSON object and no other text."
 
 @app.post("/api/projects/create-ai-context")
 async def create_ai_context(project: ProjectCreate,
-                            current_user: str = Depends(get_current_user)
+                            current_user: str = Depends(get_current_user),
+                            client: BackboardClient = Depends(get_backboard_client)
                             ):
     #pull github data into a variable
-    client = BackboardClient(api_key=BACKBOARD_API_KEY)
     scoping_assistant = await client.create_assistant(
         name="Product Manager",
         description=f"ROLE DETAILS: {SCOPING_SYSTEM_PROMPT}, PERSONAL APTITUDES: . "
@@ -671,11 +772,9 @@ async def create_ai_context(project: ProjectCreate,
         stream=False
     )
 
-    import json
-    import re
     try:
-        content = re.sub(r'```json?\n?|\n?```', '', response.content).strip()
-        ai_data = json.loads(content)
+        content = _FENCE_RE.sub('', response.content).strip()
+        ai_data = orjson.loads(content)
     except:
         ai_data = {"question": response.content, "confidence": 0.2}
     
@@ -691,11 +790,10 @@ class ContinueScoping(BaseModel):
     message: str
 
 @app.post("/api/projects/continue-scoping")
-async def continue_scoping(data: ContinueScoping):
+async def continue_scoping(data: ContinueScoping,
+                           client: BackboardClient = Depends(get_backboard_client)):
     """Continue scoping conversation - frontend loops this"""
     
-    client = BackboardClient(api_key=BACKBOARD_API_KEY)
-    
     # Send user's answer to existing thread
     response = await client.add_message(
         thread_id=data.thread_id,
@@ -707,11 +805,9 @@ async def continue_scoping(data: ContinueScoping):
     )
     
     # Parse response
-    import json
-    import re
     try:
-        content = re.sub(r'```json?\n?|\n?```', '', response.content).strip()
-        ai_data = json.loads(content)
+        content = _FENCE_RE.sub('', response.content).strip()
+        ai_data = orjson.loads(content)
     except:
         ai_data = {"question": response.content, "confidence": 0.5}
     
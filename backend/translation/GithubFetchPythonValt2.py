@@ -1,27 +1,70 @@
 #!/usr/bin/env python3
+import io
+import itertools
+import json
 import os
+import re
 import sys
-import shutil
 import subprocess
+import tarfile
+import tempfile
 import requests
 import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Optional: Use a GitHub token to increase API rate limits
-GITHUB_TOKEN = os.getenv('GITHUB_PERSACCESS_TOKEN')
+try:
+    # Optional (Linux only): batch file reads through io_uring
+    import liburing
+except ImportError:
+    liburing = None
+
+# Max reads submitted to the ring at once
+URING_ENTRIES = 256
+
+# Files bigger than this are almost always generated or minified; they're skipped
+MAX_FILE_SIZE = 1 << 20
+
+# Binary/minified sniffing: bytes probed at the start of each file, and the average
+# line length above which the file is treated as minified
+SNIFF_BYTES = 4096
+MAX_AVG_LINE_LENGTH = 2000
+
+# Wall-clock budget in seconds for one repository's tarball download, and for its git clone fallback
+FETCH_TIMEOUT = 120
+
+# Don't update access times on the files we read (Linux only)
+O_NOATIME = getattr(os, 'O_NOATIME', 0)
+
+# Optional: Use GitHub tokens to increase API rate limits.
+# Several comma-separated tokens are rotated per request, multiplying the quota.
+GITHUB_TOKENS = [t.strip() for t in os.getenv('GITHUB_PERSACCESS_TOKEN', '').split(',') if t.strip()]
+TOKEN_CYCLE = itertools.cycle(GITHUB_TOKENS)
 
 # Configurable: Number of repos to fetch (default 3 to reduce rate limit usage)
 MAX_REPOS = int(os.getenv('GITHUB_MAX_REPOS', '3'))
 
+# Repo listings are cached here with their ETag; a 304 revalidation doesn't count against the rate limit
+CACHE_DIR = Path(os.getenv('GITHUB_CACHE_DIR', Path.home() / '.cache' / 'github_fetcher'))
+
+# One keep-alive session for every API and tarball request, pooled for the parallel repo fetches
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False)))
+
 # Files to EXCLUDE
-EXCLUDE_FILES = {
+EXCLUDE_FILES = frozenset({
     'package-lock.json', 'yarn.lock', 'pnpm-lock.yaml', 'bun.lockb',
     'Cargo.lock', 'Gemfile.lock', 'composer.lock', 'poetry.lock',
     'Pipfile.lock', 'go.sum', 'Podfile.lock', '.DS_Store', 'Thumbs.db'
-}
+})
 
 # Important files to always include
-IMPORTANT_FILENAMES = {
+IMPORTANT_FILENAMES = frozenset({
     'dockerfile', 'makefile', 'procfile', 'gemfile',
     'package.json', 'requirements.txt', 'pom.xml', 
     'build.gradle', 'build.sbt', 'cargo.toml', 'go.mod',
@@ -29,23 +72,36 @@ IMPORTANT_FILENAMES = {
     'webpack.config.js', 'tsconfig.json', 'next.config.js',
     'next.config.ts', 'tailwind.config.js', 'tailwind.config.ts',
     'vite.config.js', 'vite.config.ts'
-}
+})
+
+# Extensions of files to include
+CODE_EXTENSIONS = frozenset({
+    '.py', '.js', '.java', '.cpp', '.h', '.md', '.txt',
+    '.json', '.yml', '.yaml', '.toml', '.rs', '.go',
+    '.html', '.css', '.ts', '.jsx', '.tsx', '.c', '.hpp',
+    '.cs', '.php', '.rb', '.swift', '.kt', '.scala', '.sh',
+    '.bat', '.ps1', '.sql', '.xml', '.csv', '.ini', '.cfg',
+    '.conf', '.gitignore', '.env', '.dockerfile'
+})
 
 # Directories to exclude
-EXCLUDE_DIRS = {
+EXCLUDE_DIRS = frozenset({
     'node_modules', '.next', '.nuxt', 'dist', 'build', 'out',
     '.output', '.cache', '.parcel-cache', '.eslintcache',
     '.vscode', '.idea', '__pycache__', '.pytest_cache',
     '.venv', 'venv', 'env', 'virtualenv', '.git',
-    '.github/workflows', 'target', 'vendor'
-}
+    'target', 'vendor'
+})
+
+# Any path with an excluded directory as one of its segments
+EXCLUDE_DIR_RE = re.compile(
+    r'(?:^|[/\\])(?:' + '|'.join(map(re.escape, sorted(EXCLUDE_DIRS))) + r')(?:[/\\]|$)')
 
 def should_skip_directory(path):
-    """Check if directory should be skipped"""
-    path_parts = Path(path).parts
-    return any(part in EXCLUDE_DIRS for part in path_parts)
+    """Check if directory should be skipped (for flat path listings; walks prune dirs instead)"""
+    return EXCLUDE_DIR_RE.search(path) is not None
 
-def is_code_file(filename, filepath=""):
+def is_code_file(filename):
     """Check if file should be included"""
     filename_lower = filename.lower()
     
@@ -61,18 +117,9 @@ def is_code_file(filename, filepath=""):
     if 'dockerfile' in filename_lower or 'makefile' in filename_lower:
         return True
     
-    # Only include files with valid code extensions
-    valid_extensions = {
-        '.py', '.js', '.java', '.cpp', '.h', '.md', '.txt',
-        '.json', '.yml', '.yaml', '.toml', '.rs', '.go',
-        '.html', '.css', '.ts', '.jsx', '.tsx', '.c', '.hpp',
-        '.cs', '.php', '.rb', '.swift', '.kt', '.scala', '.sh',
-        '.bat', '.ps1', '.sql', '.xml', '.csv', '.ini', '.cfg',
-        '.conf', '.sql', '.gitignore', '.env', '.dockerfile'
-    }
-    
-    _, ext = os.path.splitext(filename_lower)
-    return ext in valid_extensions
+    # Only include files with valid code extensions (a leading dot, as in ".env", isn't an extension)
+    dot = filename_lower.rfind('.')
+    return dot > 0 and filename_lower[dot:] in CODE_EXTENSIONS
 
 def extract_username_and_repo(profile_or_repo_url):
     """Extract username and repository name from a GitHub URL"""
@@ -92,6 +139,43 @@ def extract_username_and_repo(profile_or_repo_url):
     else:
         raise ValueError("Invalid GitHub URL format")
 
+def github_get(url, headers, **kwargs):
+    """GET through the shared session with the next token in the rotation.
+    If a token's quota is exhausted, retry with the following one before giving up."""
+    attempts = max(len(GITHUB_TOKENS), 1)
+    for attempt in range(attempts):
+        request_headers = dict(headers)
+        if GITHUB_TOKENS:
+            request_headers["Authorization"] = f"token {next(TOKEN_CYCLE)}"
+        
+        response = SESSION.get(url, headers=request_headers, **kwargs)
+        rate_limited = response.status_code == 403 and response.headers.get('X-RateLimit-Remaining') == '0'
+        # With zero or one token, or on the last token, hand the response back untouched
+        if not rate_limited or attempt == attempts - 1:
+            return response
+        
+        print("Token rate limited, rotating to the next one")
+        response.close()
+
+def load_cached_repos(cache_file):
+    """Load a cached {etag, data} repo listing, or None"""
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save_cached_repos(cache_file, etag, data):
+    """Persist a repo listing with its ETag (atomic replace so concurrent runs never see a partial file)"""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'etag': etag, 'data': data}, f)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"Warning: Could not cache repo listing: {e}")
+
 def fetch_all_repos_for_user(username, max_repos=None):
     """Fetch repositories for a user using GitHub API with retry logic"""
     if max_repos is None:
@@ -110,13 +194,18 @@ def fetch_all_repos_for_user(username, max_repos=None):
         "User-Agent": "GitHub-Fetcher/2.0"
     }
     
-    if GITHUB_TOKEN:
-        headers["Authorization"] = f"token {GITHUB_TOKEN}"
-        print("Using authenticated GitHub API (higher rate limits)")
+    if GITHUB_TOKENS:
+        print(f"Using authenticated GitHub API with {len(GITHUB_TOKENS)} token(s) (higher rate limits)")
     else:
         print("⚠ WARNING: No GitHub token found. Rate limit: 60 requests/hour")
         print("Set GITHUB_PERSACCESS_TOKEN environment variable for 5000 requests/hour")
     
+    # Revalidate a previous listing instead of downloading it again
+    cache_file = CACHE_DIR / f"{username.lower()}_{max_repos}.json"
+    cached = load_cached_repos(cache_file)
+    if cached and cached.get('etag'):
+        headers["If-None-Match"] = cached['etag']
+    
     # Retry logic with exponential backoff
     max_retries = 3
     for attempt in range(max_retries):
@@ -126,21 +215,21 @@ def fetch_all_repos_for_user(username, max_repos=None):
                 print(f"Retrying in {wait_time} seconds...")
                 time.sleep(wait_time)
             
-            response = requests.get(url, params=params, headers=headers, timeout=10)
-        
-        # Check rate limit status
-        rate_limit_remaining = response.headers.get('X-RateLimit-Remaining')
-        rate_limit_reset = response.headers.get('X-RateLimit-Reset')
-        
-        if rate_limit_remaining:
-            print(f"GitHub API rate limit: {rate_limit_remaining} requests remaining")
-            if int(rate_limit_remaining) < 10:
-                print(f"⚠ WARNING: Only {rate_limit_remaining} API requests remaining!")
-                if rate_limit_reset:
-                    from datetime import datetime
-                    reset_time = datetime.fromtimestamp(int(rate_limit_reset))
-                    print(f"Rate limit resets at: {reset_time}")
-        
+            response = github_get(url, headers, params=params, timeout=10)
+            
+            # Check rate limit status
+            rate_limit_remaining = response.headers.get('X-RateLimit-Remaining')
+            rate_limit_reset = response.headers.get('X-RateLimit-Reset')
+            
+            if rate_limit_remaining:
+                print(f"GitHub API rate limit: {rate_limit_remaining} requests remaining")
+                if int(rate_limit_remaining) < 10:
+                    print(f"⚠ WARNING: Only {rate_limit_remaining} API requests remaining!")
+                    if rate_limit_reset:
+                        from datetime import datetime
+                        reset_time = datetime.fromtimestamp(int(rate_limit_reset))
+                        print(f"Rate limit resets at: {reset_time}")
+            
             if response.status_code == 403:
                 retry_after = response.headers.get('Retry-After', '60')
                 print(f"❌ GitHub API rate limit exceeded! (attempt {attempt + 1}/{max_retries})")
@@ -151,8 +240,13 @@ def fetch_all_repos_for_user(username, max_repos=None):
                     print("Please set GITHUB_PERSACCESS_TOKEN environment variable for higher limits")
                     return []
             
-            if response.status_code == 200:
-                repos = response.json()
+            if response.status_code in (200, 304):
+                if response.status_code == 304:
+                    print(f"Repo listing for {username} unchanged, using cache")
+                    repos = cached['data']
+                else:
+                    repos = response.json()
+                    save_cached_repos(cache_file, response.headers.get('ETag'), repos)
                 all_repos = []
                 
                 for repo in repos[:max_repos]:
@@ -185,57 +279,234 @@ def clone_repo(clone_url, dest_dir):
     try:
         print(f"Cloning {clone_url}...")
         subprocess.run(
-            ['git', 'clone', '--depth', '1', clone_url, dest_dir],
+            ['git', '-c', 'protocol.version=2', 'clone', '--depth', '1',
+             '--single-branch', '--no-tags', '--filter=blob:none', clone_url, dest_dir],
             check=True,
             capture_output=True,
-            text=True
+            text=True,
+            # Fail fast on private/missing repos instead of waiting for credentials
+            env={**os.environ, 'GIT_TERMINAL_PROMPT': '0'},
+            timeout=FETCH_TIMEOUT
         )
         return True
     except subprocess.CalledProcessError as e:
         print(f"Error cloning repository: {e.stderr}")
         return False
+    except subprocess.TimeoutExpired:
+        print(f"Error cloning repository: timed out after {FETCH_TIMEOUT}s")
+        return False
 
-def process_local_repo(repo_path, output_file, repo_name):
-    """Process a locally cloned repository"""
-    processed_files = []
-    
-    with open(output_file, 'a', encoding='utf-8') as f:
-        f.write(f"\n{'='*80}\n")
-        f.write(f"REPOSITORY: {repo_name}\n")
-        f.write(f"{'='*80}\n\n")
+def fetch_tarball(username, repo_name, f):
+    """Stream a repository's HEAD tarball straight into an open text handle, without touching disk"""
+    url = f"https://codeload.github.com/{username}/{repo_name}/tar.gz/HEAD"
+    headers = {"User-Agent": "GitHub-Fetcher/2.0"}
     
-    # Walk through the repository
-    for root, dirs, files in os.walk(repo_path):
-        # Remove excluded directories from traversal
-        dirs[:] = [d for d in dirs if d not in EXCLUDE_DIRS]
-        
-        rel_root = os.path.relpath(root, repo_path)
-        
-        # Skip if current directory should be excluded
-        if should_skip_directory(rel_root):
-            continue
-        
-        for filename in files:
-            filepath = os.path.join(root, filename)
-            rel_filepath = os.path.relpath(filepath, repo_path)
+    processed_files = []
+    # The socket timeout only bounds each read; this bounds the whole download
+    deadline = time.monotonic() + FETCH_TIMEOUT
+    try:
+        print(f"Downloading {username}/{repo_name} tarball...")
+        with github_get(url, headers, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
             
-            if is_code_file(filename, rel_filepath):
-                try:
-                    with open(filepath, 'r', encoding='utf-8', errors='ignore') as file_content:
-                        content = file_content.read()
+            f.write(f"\n{'='*80}\nREPOSITORY: {repo_name}\n{'='*80}\n\n")
+            
+            with tarfile.open(fileobj=response.raw, mode='r|gz') as tf:
+                for member in tf:
+                    if time.monotonic() > deadline:
+                        raise TimeoutError(f"tarball download exceeded {FETCH_TIMEOUT}s")
+                    if not member.isfile():
+                        continue
+                    # Drop the "<user>-<repo>-<sha>/" prefix GitHub puts on every entry
+                    parts = member.name.split('/', 1)
+                    if len(parts) < 2:
+                        continue
+                    rel_filepath = parts[1]
+                    rel_root, filename = os.path.split(rel_filepath)
+                    if should_skip_directory(rel_root) or not is_code_file(filename):
+                        continue
+                    if member.size > MAX_FILE_SIZE:
+                        print(f"Skipped: {rel_filepath}")
+                        continue
                     
-                    with open(output_file, 'a', encoding='utf-8') as f:
-                        f.write(f"\n{'='*80}\n")
-                        f.write(f"FILE: {rel_filepath}\n")
-                        f.write(f"{'='*80}\n\n")
-                        f.write(content)
-                        f.write("\n\n")
+                    data = tf.extractfile(member).read()
+                    if not looks_like_source(data):
+                        print(f"Skipped: {rel_filepath}")
+                        continue
+                    content = decode_text(data)
+                    f.writelines((f"\n{'='*80}\nFILE: {rel_filepath}\n{'='*80}\n\n", content, "\n\n"))
                     
                     processed_files.append(rel_filepath)
                     print(f"Processed: {rel_filepath}")
-                    
-                except Exception as e:
-                    print(f"Error reading {rel_filepath}: {e}")
+        return processed_files
+    except (requests.exceptions.RequestException, tarfile.TarError, OSError) as e:
+        print(f"Error downloading tarball: {e}")
+        return None
+
+def fetch_repo(username, repo_name, clone_url):
+    """Dump one repository into memory via its tarball, falling back to git clone.
+    Returns (dump_text, processed_files), or None if both fail."""
+    buffer = io.StringIO()
+    files = fetch_tarball(username, repo_name, buffer)
+    if files is None:
+        buffer = io.StringIO()
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as temp_dir:
+            repo_dir = os.path.join(temp_dir, repo_name)
+            if not clone_repo(clone_url, repo_dir):
+                return None
+            files = process_local_repo(repo_dir, buffer, repo_name)
+    return buffer.getvalue(), files
+
+def open_uring():
+    """Set up an io_uring ring, or return None if io_uring isn't available"""
+    if liburing is None or sys.platform != 'linux':
+        return None
+    ring = liburing.Ring()
+    try:
+        liburing.io_uring_queue_init(URING_ENTRIES, ring)
+    except OSError:
+        return None
+    return ring
+
+def open_raw(filepath):
+    """Open a file for unbuffered reading, with O_NOATIME where the kernel allows it"""
+    try:
+        return os.open(filepath, os.O_RDONLY | O_NOATIME)
+    except PermissionError:
+        # O_NOATIME is refused on files we don't own
+        if not O_NOATIME:
+            raise
+        return os.open(filepath, os.O_RDONLY)
+
+def looks_like_source(data):
+    """Sniff the first SNIFF_BYTES: reject binaries (NUL bytes) and minified files (very long lines)"""
+    probe = data[:SNIFF_BYTES]
+    if b'\0' in probe:
+        return False
+    return len(probe) / max(probe.count(b'\n'), 1) <= MAX_AVG_LINE_LENGTH
+
+def decode_text(data):
+    """Decode raw bytes the way a text-mode read does: drop bad bytes, normalise newlines"""
+    return data.decode('utf-8', errors='ignore').replace('\r\n', '\n').replace('\r', '\n')
+
+def read_file(filepath):
+    """Read one file synchronously in a single read.
+    Returns the text, None if the file is skipped (too large, binary or minified),
+    or the exception on failure."""
+    try:
+        fd = open_raw(filepath)
+        try:
+            size = os.fstat(fd).st_size
+            if size > MAX_FILE_SIZE:
+                return None
+            data = os.read(fd, size)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        return e
+    return decode_text(data) if looks_like_source(data) else None
+
+def read_files_uring(ring, filepaths):
+    """Read a batch of files with one io_uring submission per URING_ENTRIES files.
+    Returns the texts in order, with None for skipped files (too large, binary or minified)
+    and the exception in place of any file that failed."""
+    contents = [None] * len(filepaths)
+    
+    for start in range(0, len(filepaths), URING_ENTRIES):
+        fds = []
+        buffers = {}
+        try:
+            for i in range(start, min(start + URING_ENTRIES, len(filepaths))):
+                try:
+                    fd = open_raw(filepaths[i])
+                except OSError as e:
+                    contents[i] = e
+                    continue
+                fds.append(fd)
+                size = os.fstat(fd).st_size
+                if size > MAX_FILE_SIZE:
+                    continue
+                buffers[i] = bytearray(size)
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_read(sqe, fd, buffers[i], 0)
+                sqe.user_data = i
+            
+            liburing.io_uring_submit(ring)
+            
+            cqe = liburing.Cqe()
+            for _ in buffers:
+                liburing.io_uring_wait_cqe(ring, cqe)
+                entry = cqe[0]
+                i = entry.user_data
+                try:
+                    data = bytes(buffers[i][:entry.res])
+                    contents[i] = decode_text(data) if looks_like_source(data) else None
+                except OSError as e:
+                    contents[i] = e
+                finally:
+                    liburing.io_uring_cqe_seen(ring, entry)
+        finally:
+            for fd in fds:
+                os.close(fd)
+    
+    return contents
+
+def walk_code_files(repo_path):
+    """Yield each directory's code files as a list of (filepath, rel_filepath), in os.walk's
+    top-down order. Uses scandir's cached entry types, never descends into EXCLUDE_DIRS,
+    and doesn't follow symlinks out of the checkout."""
+    stack = [(repo_path, '')]
+    while stack:
+        path, rel_path = stack.pop()
+        batch = []
+        subdirs = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in EXCLUDE_DIRS:
+                            subdirs.append((entry.path, os.path.join(rel_path, entry.name)))
+                    elif entry.is_file(follow_symlinks=False) and is_code_file(entry.name):
+                        batch.append((entry.path, os.path.join(rel_path, entry.name)))
+        except OSError:
+            continue
+        
+        if batch:
+            yield batch
+        # Reversed so the first subdirectory is visited next, as in os.walk
+        stack.extend(reversed(subdirs))
+
+def process_local_repo(repo_path, f, repo_name):
+    """Process a locally cloned repository, writing its files to an open text handle"""
+    processed_files = []
+    
+    f.write(f"\n{'='*80}\nREPOSITORY: {repo_name}\n{'='*80}\n\n")
+    
+    ring = open_uring()
+    try:
+        # Walk through the repository one directory at a time
+        for batch in walk_code_files(repo_path):
+            # Only worth going through the ring when there's more than one read
+            if ring is not None and len(batch) > 1:
+                contents = read_files_uring(ring, [filepath for filepath, _ in batch])
+            else:
+                contents = [read_file(filepath) for filepath, _ in batch]
+            
+            for (_, rel_filepath), content in zip(batch, contents):
+                if content is None:
+                    print(f"Skipped: {rel_filepath}")
+                    continue
+                if isinstance(content, Exception):
+                    print(f"Error reading {rel_filepath}: {content}")
+                    continue
+                
+                f.writelines((f"\n{'='*80}\nFILE: {rel_filepath}\n{'='*80}\n\n", content, "\n\n"))
+                processed_files.append(rel_filepath)
+                print(f"Processed: {rel_filepath}")
+    finally:
+        if ring is not None:
+            liburing.io_uring_queue_exit(ring)
     
     return processed_files
 
@@ -243,97 +514,45 @@ def fetch_github_repo(profile_or_repo_url, output_file="RESULTS.txt"):
     """Main function to fetch GitHub repositories"""
     username, repo = extract_username_and_repo(profile_or_repo_url)
     
-    temp_dir = "temp_repos"
+    # Determine which repos to process
+    repos_to_process = []
     
-    try:
-
-        # failsafe clean
-        if os.path.exists(temp_dir):
-            try:
-                shutil.rmtree(temp_dir, ignore_errors=True)
-                print(f"Cleaned up existing {temp_dir} directory")
-            except Exception as e:
-                print(f"Warning: Could not clean up existing {temp_dir}: {e}")
-        
-        # Create temp directory for clones
-        os.makedirs(temp_dir, exist_ok=True)
-        
-        
-        # Determine which repos to process
-        repos_to_process = []
-        
-        if repo == "ALL":
-            repos_info = fetch_all_repos_for_user(username, max_repos=MAX_REPOS)
-            repos_to_process = [(r['name'], r['clone_url']) for r in repos_info]
-        else:
-            clone_url = f"https://github.com/{username}/{repo}.git"
-            repos_to_process = [(repo, clone_url)]
-        
-        # Clear output file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(f"GitHub Repositories Dump\n")
-            f.write(f"User: {username}\n")
-            f.write(f"{'='*80}\n\n")
-        
-        total_files = 0
+    if repo == "ALL":
+        repos_info = fetch_all_repos_for_user(username, max_repos=MAX_REPOS)
+        repos_to_process = [(r['name'], r['clone_url']) for r in repos_info]
+    else:
+        clone_url = f"https://github.com/{username}/{repo}.git"
+        repos_to_process = [(repo, clone_url)]
+    
+    total_files = 0
+    
+    # One handle with a 1 MiB buffer for the whole dump
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(f"GitHub Repositories Dump\nUser: {username}\n{'='*80}\n\n")
         
-        # Process each repository
-        for repo_name, clone_url in repos_to_process:
-            repo_dir = os.path.join(temp_dir, repo_name)
+        # Fetch all repositories in parallel (network-bound), but write them
+        # one at a time in the original order so the output file stays ordered
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(repos_to_process)))) as executor:
+            dumps = [executor.submit(fetch_repo, username, repo_name, clone_url)
+                     for repo_name, clone_url in repos_to_process]
             
-            # Clone the repository
-            if clone_repo(clone_url, repo_dir):
-                # Process the cloned repository
-                files = process_local_repo(repo_dir, output_file, repo_name)
+            for (repo_name, _), dump in zip(repos_to_process, dumps):
+                result = dump.result()
+                if result is None:
+                    print(f"Skipping {repo_name} due to fetch failure")
+                    continue
+                
+                text, files = result
+                f.write(text)
                 total_files += len(files)
                 print(f"Processed {len(files)} files from {repo_name}")
-            else:
-                print(f"Skipping {repo_name} due to clone failure")
-            
-            # Always clean up the repo directory after processing (success or failure)
-            if os.path.exists(repo_dir):
-                try:
-                    shutil.rmtree(repo_dir, ignore_errors=True)
-                except Exception as e:
-                    print(f"Warning: Error cleaning {repo_dir}: {e}")
-        
-        print(f"\nDone! Saved {total_files} files to {output_file}")
-        return output_file
-        
-    finally:
-        # Ensure temp directory is cleaned up with aggressive retry logic
-        import time
-        time.sleep(1)  # Give file handles time to close
-        
-        if os.path.exists(temp_dir):
-            # Retry multiple times to handle file locks
-            for attempt in range(5):
-                try:
-                    # First, try to remove read-only attributes (Windows issue)
-                    for root, dirs, files in os.walk(temp_dir, topdown=False):
-                        for name in files:
-                            filepath = os.path.join(root, name)
-                            try:
-                                os.chmod(filepath, 0o777)
-                            except:
-                                pass
-                        for name in dirs:
-                            dirpath = os.path.join(root, name)
-                            try:
-                                os.chmod(dirpath, 0o777)
-                            except:
-                                pass
-                    
-                    # Now try to remove the directory
-                    shutil.rmtree(temp_dir, ignore_errors=False)
-                    print(f"✓ Fully cleaned up {temp_dir}")
-                    break
-                except Exception as e:
-                    if attempt < 4:
-                        print(f"Cleanup attempt {attempt + 1} failed, retrying... ({e})")
-                        time.sleep(1)
-                    else:
-                        print(f"Warning: Could not fully clean up {temp_dir} after 5 attempts: {e}")
+    
+    print(f"\nDone! Saved {total_files} files to {output_file}")
+    return output_file
+
+def run(profile_or_repo_url, output_file="RESULTS.txt"):
+    """Pipeline entry point: dump the repositories behind a profile/repo URL into output_file"""
+    return fetch_github_repo(profile_or_repo_url, output_file)
 
 if __name__ == "__main__":
     # print("HELPPPPPPPPPPPPPPP")
@@ -344,4 +563,4 @@ if __name__ == "__main__":
     
     profile_or_repo_url = sys.argv[1]
     output_file = sys.argv[2] if len(sys.argv) > 2 else "RESULTS.txt"
-    fetch_github_repo(profile_or_repo_url, output_file)
\ No newline at end of file
+    run(profile_or_repo_url, output_file)
\ No newline at end of file
@@ -1,15 +1,69 @@
-import json
 import re
-from collections import defaultdict
+import heapq
+from collections import Counter, defaultdict
 from datetime import datetime
 import statistics
 from pathlib import Path
+import numpy as np
+import orjson
 
-def analyze_github_dump(text):
+try:
+    # Optional: RE2 runs the scans below in linear time instead of backtracking
+    import re2 as re_engine
+except ImportError:
+    re_engine = re
+
+# Pretty-printed like the old json.dump(indent=2); numpy arrays serialize natively
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+
+# Section banner line written by GithubFetchPythonValt2 around REPOSITORY/FILE headers
+MARKER = '=' * 80
+
+# Patterns are compiled once at import, with inline flags so they work under either engine.
+# File extensions and commit dates. Languages, file types and code file counts are all
+# derived from the extension counts. Dates keep their own scan: a fused alternation would
+# let an extension like '.b2024' swallow the year of a date that follows it.
+FILE_EXTENSION_RE = re_engine.compile(r'\.([a-zA-Z0-9]+)\b')
+COMMIT_DATE_RE = re_engine.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}')
+
+# Extension (lowercased) -> language
+LANGUAGE_NAMES = {
+    'py': 'Python',
+    'js': 'JavaScript',
+    'ts': 'TypeScript',
+    'sh': 'Shell',
+    'json': 'JSON',
+    'md': 'Markdown',
+    'yml': 'YAML',
+    'yaml': 'YAML',
+    'html': 'HTML',
+    'css': 'CSS',
+}
+LANGUAGE_ORDER = ['Python', 'JavaScript', 'TypeScript', 'Shell', 'JSON', 'Markdown', 'YAML', 'HTML', 'CSS']
+
+PY_IMPORT_RE = re_engine.compile(r'(?:import|from)\s+([a-zA-Z0-9_.-]+)')
+PACKAGE_VERSION_RE = re_engine.compile(r'"([a-zA-Z0-9_-]+)":\s*"\d+\.\d+\.\d+"')
+
+FRAMEWORK_PATTERNS = {
+    'pytest': re_engine.compile(r'(?i)\bpytest\b'),
+    'GitHub Actions': re_engine.compile(r'(?i)\.github/workflows'),
+    'Git': re_engine.compile(r'(?i)\bgit\b'),
+    'Docker': re_engine.compile(r'(?i)\bdocker\b'),
+    'Claude Code': re_engine.compile(r'(?i)\bclaude.code\b|claude-plugin'),
+    'Ollama': re_engine.compile(r'(?i)\bollama\b'),
+    'MCP': re_engine.compile(r'(?i)\bmcp\b'),
+}
+
+# All test indicators fused into one alternation
+TEST_INDICATOR_RE = re_engine.compile(
+    r'(?i)\btest[_-]|[_-]test\.|\.test\.|\bspec/|\btest/|\btesting\b|\bassert\b|\bpytest\b')
+CODE_FILE_EXTENSIONS = ('py', 'js', 'ts', 'sh')
+
+def analyze_github_dump(input_file):
     """Analyze the GitHub repository dump and create both filtered and translated outputs"""
     
-    # Parse the dump into repository sections
-    repos = parse_repositories(text)
+    # Stream the dump one repository at a time
+    repos = iter_repositories(input_file)
     
     # Create filtered data
     filtered_data = create_filtered_data(repos)
@@ -19,41 +73,55 @@ def analyze_github_dump(text):
     
     return filtered_data, translated_data
 
-def parse_repositories(text):
-    """Parse the GitHub dump into individual repositories"""
-    repos = []
-    
-    # Split by repository markers
-    repo_sections = re.split(r'={80}\nREPOSITORY:\s*(.+?)\n={80}', text)
-    
-    # Process each repository (skip first section which is header)
-    for i in range(1, len(repo_sections), 2):
-        if i + 1 < len(repo_sections):
-            repo_name = repo_sections[i].strip()
-            repo_content = repo_sections[i + 1]
-            
-            repos.append({
-                'name': repo_name,
-                'content': repo_content
-            })
+def iter_repositories(input_file):
+    """Read the GitHub dump line by line, yielding (name, content) for each repository.
+    Only one repository's content is held in memory at a time."""
+    name = None
+    buffer = []
     
-    return repos
+    with open(input_file, 'r', encoding='utf-8', errors='ignore') as f:
+        lines = iter(f)
+        for line in lines:
+            if not line.startswith(MARKER):
+                buffer.append(line)
+                continue
+            
+            # A repository banner is MARKER / "REPOSITORY: name" / MARKER
+            header = next(lines, '')
+            if not header.startswith('REPOSITORY:'):
+                buffer.extend((line, header))
+                continue
+            closing = next(lines, '')
+            if not closing.startswith(MARKER):
+                buffer.extend((line, header, closing))
+                continue
+            
+            # Anything before the first banner is the dump header
+            if name is not None:
+                content = ''.join(buffer)
+                buffer.clear()
+                yield name, content
+            name = header[len('REPOSITORY:'):].strip()
+            buffer = [closing[len(MARKER):]]
+    
+    if name is not None:
+        yield name, ''.join(buffer)
 
 def create_filtered_data(repos):
     """Create filtered.json structure"""
     repositories = []
-    all_commits = []
+    all_commit_dates = []
     all_languages = set()
     
-    for repo_data in repos:
-        repo_info = analyze_single_repo(repo_data['name'], repo_data['content'])
+    for name, content in repos:
+        repo_info = analyze_single_repo(name, content)
         repositories.append(repo_info)
-        all_commits.extend(repo_info['commits'])
+        all_commit_dates.extend(repo_info['commits']['dates'])
         all_languages.update(repo_info['languages'].keys())
     
     # Calculate stats for home page
     total_projects = len(repositories)
-    total_commits = len(all_commits)
+    total_commits = len(all_commit_dates)
     total_languages = len(all_languages)
     
     # Calculate rating based on activity and diversity
@@ -111,13 +179,13 @@ def create_filtered_data(repos):
     # Create new projects list (most recent repositories by analyzing commit patterns)
     new_projects = []
     # Sort by number of recent commits (last in commit list)
-    repos_with_recent = sorted(repositories, key=lambda r: len(r['commits']), reverse=True)[:5]
+    repos_with_recent = sorted(repositories, key=lambda r: len(r['commits']['dates']), reverse=True)[:5]
     
     for repo in repos_with_recent:
         primary_lang = max(repo['languages'].items(), key=lambda x: x[1])[0] if repo['languages'] else 'Unknown'
         
         # Calculate "time ago" for created date (simplified)
-        commit_count = len(repo['commits'])
+        commit_count = len(repo['commits']['dates'])
         created_at = f"{commit_count} commits" if commit_count > 0 else "No commits"
         
         new_projects.append({
@@ -134,15 +202,15 @@ def create_filtered_data(repos):
     # Collect all commits with their repo names
     all_commits_with_repo = []
     for repo in repositories:
-        for commit in repo['commits'][:3]:  # Take top 3 commits per repo
+        for date in repo['commits']['dates'][:3]:  # Take top 3 commits per repo
             all_commits_with_repo.append({
                 'repo': repo['name'],
-                'commit': commit,
+                'date': date,
                 'languages': repo['languages']
             })
     
     # Sort by date and take most recent
-    all_commits_with_repo.sort(key=lambda x: x['commit'].get('date', ''), reverse=True)
+    all_commits_with_repo.sort(key=lambda x: x['date'], reverse=True)
     
     # If we have commits, use them
     if all_commits_with_repo:
@@ -154,10 +222,9 @@ def create_filtered_data(repos):
             # Get primary language for this repo
             primary_lang = max(item['languages'].items(), key=lambda x: x[1])[0] if item['languages'] else 'Unknown'
             
-            commit_msg = item['commit'].get('message', 'Work on repository')[:50]
-            
+            # Only commit dates are recovered from the dump, not messages
             recent_works.append({
-                'nameRecent': commit_msg,
+                'nameRecent': 'Work on repository',
                 'projectRecent': item['repo'],
                 'statusRecent': status,
                 'priorityRecent': priority,
@@ -187,7 +254,7 @@ def create_filtered_data(repos):
     return {
         'repositories': repositories,
         'total_commits': total_commits,
-        'commit_dates': sorted([c['date'] for c in all_commits if c.get('date')]),
+        'commit_dates': sorted(all_commit_dates),
         'statsHome': {
             'totalProjects': total_projects,
             'totalRating': star_rating,
@@ -204,8 +271,11 @@ def create_filtered_data(repos):
 def analyze_single_repo(name, content):
     """Analyze a single repository"""
     
+    # Shared extension counts and dates
+    extensions, dates = scan_tokens(content)
+    
     # Detect languages
-    languages = detect_languages(content)
+    languages = detect_languages(extensions)
     
     # Detect libraries (with frequency)
     libraries = detect_libraries(content)
@@ -214,16 +284,16 @@ def analyze_single_repo(name, content):
     frameworks = detect_frameworks(content)
     
     # Parse commits (if available)
-    commits = parse_commits(content)
+    commits = parse_commits(dates)
     
     # Estimate size
     size_kb = len(content) / 1024
     
     # Analyze file types
-    file_types = analyze_file_types(content)
+    file_types = analyze_file_types(extensions)
     
     # Estimate test coverage
-    test_coverage = estimate_test_coverage(content)
+    test_coverage = estimate_test_coverage(content, extensions)
     
     return {
         'name': name,
@@ -236,118 +306,83 @@ def analyze_single_repo(name, content):
         'test_coverage': test_coverage
     }
 
-def detect_languages(text):
+def scan_tokens(text):
+    """Scan the text for raw extension counts and commit date strings"""
+    extensions = Counter(FILE_EXTENSION_RE.findall(text))
+    dates = COMMIT_DATE_RE.findall(text)
+    
+    return extensions, dates
+
+def detect_languages(extensions):
     """Detect programming languages from file extensions"""
     languages = defaultdict(int)
     
-    patterns = {
-        'Python': r'\.py\b',
-        'JavaScript': r'\.js\b',
-        'TypeScript': r'\.ts\b',
-        'Shell': r'\.sh\b',
-        'JSON': r'\.json\b',
-        'Markdown': r'\.md\b',
-        'YAML': r'\.yml\b|\.yaml\b',
-        'HTML': r'\.html\b',
-        'CSS': r'\.css\b',
-    }
+    for ext, count in extensions.items():
+        lang = LANGUAGE_NAMES.get(ext.lower())
+        if lang:
+            languages[lang] += count
     
-    for lang, pattern in patterns.items():
-        matches = len(re.findall(pattern, text, re.IGNORECASE))
-        if matches > 0:
-            languages[lang] = matches
-    
-    return dict(languages)
+    return {lang: languages[lang] for lang in LANGUAGE_ORDER if languages[lang] > 0}
 
 def detect_libraries(text):
     """Detect libraries with frequency counts"""
-    libraries = defaultdict(int)
-    
     # Python imports
-    py_imports = re.findall(r'(?:import|from)\s+([a-zA-Z0-9_.-]+)', text)
-    for lib in py_imports:
-        base_lib = lib.split('.')[0]
-        libraries[base_lib] += 1
+    py_imports = PY_IMPORT_RE.findall(text)
+    libraries = Counter(lib.split('.')[0] for lib in py_imports)
     
     # Package names from JSON
     # Look for common package manager patterns
-    package_names = re.findall(r'"([a-zA-Z0-9_-]+)":\s*"\d+\.\d+\.\d+"', text)
-    for pkg in package_names:
-        libraries[pkg] += 1
+    libraries.update(PACKAGE_VERSION_RE.findall(text))
     
     # Filter out very common/standard items
     filtered = {lib: count for lib, count in libraries.items() 
                if len(lib) > 2 and lib not in ['sys', 'os', 'io', 're']}
     
-    return dict(sorted(filtered.items(), key=lambda x: x[1], reverse=True)[:30])
+    # Top 30 without sorting everything (ties keep first-seen order, as sorted() did)
+    return dict(heapq.nlargest(30, filtered.items(), key=lambda x: x[1]))
 
 def detect_frameworks(text):
     """Detect frameworks"""
     frameworks = set()
     
-    patterns = {
-        'pytest': r'\bpytest\b',
-        'GitHub Actions': r'\.github/workflows',
-        'Git': r'\bgit\b',
-        'Docker': r'\bdocker\b',
-        'Claude Code': r'\bclaude.code\b|claude-plugin',
-        'Ollama': r'\bollama\b',
-        'MCP': r'\bmcp\b',
-    }
-    
-    for framework, pattern in patterns.items():
-        if re.search(pattern, text, re.IGNORECASE):
+    for framework, pattern in FRAMEWORK_PATTERNS.items():
+        if pattern.search(text):
             frameworks.add(framework)
     
     return sorted(list(frameworks))
 
-def parse_commits(text):
-    """Parse commit information"""
-    commits = []
-    
-    # Look for date patterns in the content
-    date_patterns = re.findall(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})', text)
+def parse_commits(dates):
+    """Parse commit information from date strings found in the content.
+    Stored as parallel arrays ({'dates': [...], 'timestamps': ndarray}) rather than a dict per commit."""
+    commit_dates = []
+    timestamps = []
     
-    for date_str in date_patterns[:100]:  # Limit to avoid over-counting
+    for date_str in dates[:100]:  # Limit to avoid over-counting
         try:
-            timestamp = datetime.fromisoformat(date_str.replace('Z', '+00:00')).timestamp()
-            commits.append({
-                'date': date_str,
-                'timestamp': timestamp
-            })
-        except:
+            timestamps.append(datetime.fromisoformat(date_str.replace('Z', '+00:00')).timestamp())
+        except ValueError:
             continue
+        commit_dates.append(date_str)
     
-    return commits
+    return {
+        'dates': commit_dates,
+        'timestamps': np.array(timestamps, dtype=np.float64)
+    }
 
-def analyze_file_types(text):
+def analyze_file_types(extensions):
     """Analyze file type distribution"""
     file_types = defaultdict(int)
     
-    # Match file extensions
-    extensions = re.findall(r'\.([a-zA-Z0-9]+)\b', text)
-    for ext in extensions:
-        file_types[ext.lower()] += 1
+    for ext, count in extensions.items():
+        file_types[ext.lower()] += count
     
-    return dict(sorted(file_types.items(), key=lambda x: x[1], reverse=True)[:20])
+    return dict(heapq.nlargest(20, file_types.items(), key=lambda x: x[1]))
 
-def estimate_test_coverage(text):
+def estimate_test_coverage(text, extensions):
     """Estimate test coverage"""
-    test_indicators = [
-        r'\btest[_-]',
-        r'[_-]test\.',
-        r'\.test\.',
-        r'\bspec/',
-        r'\btest/',
-        r'\btesting\b',
-        r'\bassert\b',
-        r'\bpytest\b',
-    ]
-    
-    test_matches = sum(len(re.findall(pattern, text, re.IGNORECASE)) 
-                      for pattern in test_indicators)
-    
-    code_files = len(re.findall(r'\.(py|js|ts|sh)\b', text))
+    test_matches = len(TEST_INDICATOR_RE.findall(text))
+    
+    code_files = sum(extensions.get(ext, 0) for ext in CODE_FILE_EXTENSIONS)
     
     if code_files == 0:
         return 0.0
@@ -385,28 +420,30 @@ def create_translated_data(filtered_data):
     frameworks = dict(sorted(framework_counts.items(), key=lambda x: x[1], reverse=True))
     
     # Analyze habits
-    all_commits = []
     commit_sizes = []
     for repo in filtered_data['repositories']:
-        all_commits.extend(repo['commits'])
-        if len(repo['commits']) > 0:
-            avg_size = repo['size_kb'] / len(repo['commits'])
-            commit_sizes.extend([avg_size] * len(repo['commits']))
-    
-    timestamps = [c['timestamp'] for c in all_commits if c.get('timestamp')]
-    if len(timestamps) > 1:
-        time_span_days = (max(timestamps) - min(timestamps)) / 86400
-        frequency = len(timestamps) / max(time_span_days / 7, 1) if time_span_days > 0 else 0
+        commit_count = len(repo['commits']['dates'])
+        if commit_count > 0:
+            avg_size = repo['size_kb'] / commit_count
+            commit_sizes.extend([avg_size] * commit_count)
+    
+    timestamps = np.sort(np.concatenate(
+        [np.asarray(repo['commits']['timestamps'], dtype=np.float64) for repo in filtered_data['repositories']]
+        or [np.empty(0)]))
+    if timestamps.size > 1:
+        time_span_days = (timestamps[-1] - timestamps[0]) / 86400
+        frequency = float(timestamps.size / max(time_span_days / 7, 1)) if time_span_days > 0 else 0
     else:
         frequency = 0.0
     
-    if len(timestamps) > 2:
-        intervals = [timestamps[i+1] - timestamps[i] for i in range(len(timestamps)-1)]
-        consistency = 1.0 / (1.0 + statistics.stdev(intervals) / 86400)
+    # Spread of the gaps between consecutive commits, in chronological order
+    intervals = np.diff(timestamps)
+    if intervals.size > 1:
+        consistency = float(1.0 / (1.0 + intervals.std(ddof=1) / 86400))
     else:
         consistency = 0.0
     
-    avg_commit_size = statistics.mean(commit_sizes) if commit_sizes else 0.0
+    avg_commit_size = float(np.mean(commit_sizes)) if commit_sizes else 0.0
     
     if frequency > 5:
         pattern = 'daily'
@@ -531,39 +568,42 @@ def create_translated_data(filtered_data):
         }
     }
 
-if __name__ == '__main__':
-    import sys
-    
-    if len(sys.argv) < 2:
-        print("Usage: python analyze_github.py <github_dump.txt> [output_dir]")
-        sys.exit(1)
-    
-    # input_file = sys.argv[1]
-    
-    # received as str now, so convert back to path
-    input_file = Path(sys.argv[1])
-    output_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else Path('.')
+def run(input_file, output_dir='.'):
+    """Pipeline entry point: analyze a dump file, write filtered/translated JSON, return filtered data"""
+    input_file = Path(input_file)
+    output_dir = Path(output_dir)
 
-    # Read the GitHub dump
-    with open(input_file, 'r', encoding='utf-8', errors='ignore') as f:
-        text = f.read()
-    
     # Analyze
-    filtered_data, translated_data = analyze_github_dump(text)
+    filtered_data, translated_data = analyze_github_dump(input_file)
     
     # Save filtered.json
     filtered_output = output_dir / 'filtered.json'
-    with open(filtered_output, 'w', encoding='utf-8') as f:
-        json.dump(filtered_data, f, indent=2)
+    with open(filtered_output, 'wb') as f:
+        f.write(orjson.dumps(filtered_data, option=JSON_OPTIONS))
     print(f"Created {filtered_output} with {len(filtered_data['repositories'])} repositories")
     
     # Save translated.json (will be overwritten by translation.py, but keep for now)
     translated_output = output_dir / 'translated.json'
-    with open(translated_output, 'w', encoding='utf-8') as f:
-        json.dump(translated_data, f, indent=2)
+    with open(translated_output, 'wb') as f:
+        f.write(orjson.dumps(translated_data, option=JSON_OPTIONS))
     print(f"Created {translated_output}")
     print(f"\nDeveloper Profile Summary:")
     print(f"  Top Languages: {list(translated_data['languages'].keys())[:3]}")
     print(f"  Primary Skills: {list(translated_data['skills'].keys())}")
     print(f"  Commit Pattern: {translated_data['habits']['commit_pattern']}")
-    print(f"  Technical Level: {translated_data['technical_depth']['level']}")
\ No newline at end of file
+    print(f"  Technical Level: {translated_data['technical_depth']['level']}")
+
+    return filtered_data
+
+if __name__ == '__main__':
+    import sys
+    
+    if len(sys.argv) < 2:
+        print("Usage: python analyze_github.py <github_dump.txt> [output_dir]")
+        sys.exit(1)
+    
+    # received as str now, so convert back to path
+    input_file = Path(sys.argv[1])
+    output_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else Path('.')
+
+    run(input_file, output_dir)
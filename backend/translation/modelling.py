@@ -1,9 +1,142 @@
-import json
-import math
-from typing import Dict, List, Tuple
-from dataclasses import dataclass, asdict
+import heapq
+import sys
+from dataclasses import dataclass
 
-@dataclass
+import numpy as np
+import orjson
+
+try:
+    # Optional: compiles the batch scoring loop for DivergencePredictiveModel.compute_batch
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def compute_all_numba(S, W_fric, W_cap):
+        """
+        Score every profile row of S (n_profiles x n_inputs) at once
+        Returns (friction, capability): friction floored at 0, capability capped at 1
+        """
+        n = S.shape[0]
+        friction = np.empty((n, W_fric.shape[0]))
+        capability = np.empty((n, W_cap.shape[0]))
+
+        for i in prange(n):
+            for j in range(W_fric.shape[0]):
+                total = 0.0
+                for k in range(S.shape[1]):
+                    total += W_fric[j, k] * S[i, k]
+                friction[i, j] = max(1.0 - total, 0.0)
+
+            for j in range(W_cap.shape[0]):
+                total = 0.0
+                for k in range(S.shape[1]):
+                    total += W_cap[j, k] * S[i, k]
+                capability[i, j] = min(total, 1.0)
+
+        return friction, capability
+
+    # Compile (or load from the on-disk cache) at import, not on the first batch
+    _warmup = np.zeros((1, 1))
+    compute_all_numba(_warmup, _warmup, _warmup)
+else:
+    # NumPy fallback in compute_batch
+    compute_all_numba = None
+
+# Library (lowercase) -> purpose category, built once at import
+LIBRARY_CATEGORIES = {
+    # AI/ML libraries
+    **dict.fromkeys(['openai', 'anthropic', 'transformers', 'pytorch', 'tensorflow',
+                     'sklearn', 'keras', 'langchain'], 'ai_ml'),
+    # Data processing
+    **dict.fromkeys(['pandas', 'numpy', 'scipy', 'polars', 'dask'], 'data_processing'),
+    # Web frameworks
+    **dict.fromkeys(['flask', 'django', 'fastapi', 'express', 'react', 'vue', 'angular'], 'web_framework'),
+    # DevOps/Infrastructure
+    **dict.fromkeys(['docker', 'kubernetes', 'terraform', 'ansible'], 'devops'),
+    # Testing
+    **dict.fromkeys(['pytest', 'unittest', 'jest', 'mocha', 'cypress'], 'testing'),
+    # CLI/Tooling - KEY INDICATORS FOR DEVTOOLS SKILL
+    **dict.fromkeys(['argparse', 'click', 'typer', 'rich', 'colorama', 'prompt-toolkit'], 'cli_tool'),
+    # Async/Concurrency
+    **dict.fromkeys(['asyncio', 'aiohttp', 'celery', 'threading'], 'async'),
+    # Data structures (advanced Python usage)
+    **dict.fromkeys(['collections', 'itertools', 'functools', 'heapq', 'deque',
+                     'counter', 'lru_cache', 'cache'], 'advanced_python'),
+}
+
+# Libraries that bump AI/ML skill and type-safety preference
+AI_LIBS = frozenset({'openai', 'anthropic', 'langchain'})
+TYPING_LIBS = frozenset({'typing', 'mypy', 'pydantic'})
+
+# Languages summed into the frontend share of the skill vector
+FRONTEND_LANGUAGES = ('JavaScript', 'TypeScript', 'HTML', 'CSS')
+
+# Devtools indicators: CLI tooling, advanced Python patterns, testing
+CLI_INDICATORS = frozenset({'argparse', 'click', 'typer', 'rich', 'colorama'})
+ADVANCED_INDICATORS = frozenset({'functools', 'itertools', 'collections', 'heapq',
+                                 'lru_cache', 'cache', 'deque'})
+TESTING_INDICATORS = frozenset({'pytest', 'unittest', 'mock'})
+
+# Report bars for 0..20 blocks, indexed by int(score * 20)
+_BARS = tuple('█' * i for i in range(21))
+
+# Columns of the weight matrices below, packed by _score_inputs
+SCORE_INPUTS = ('backend', 'frontend', 'data', 'ai_ml', 'cloud_infrastructure', 'architecture',
+                'type_safety', 'language_diversity', 'complexity_tolerance', 'quality', 'devtools')
+
+# Friction = 1 - inputs @ FRICTION_WEIGHTS.T, one row per FrictionProfile field
+FRICTION_WEIGHTS = np.array([
+    #  be   fe  data   ai cloud arch type lang cplx qual  dev
+    [0.0, 0.4, 0.0, 0.0, 0.0, 0.0, 0.3, 0.0, 0.3, 0.0, 0.0],  # react (frontend + typing + complexity)
+    [0.0, 0.6, 0.0, 0.0, 0.0, 0.0, 0.0, 0.4, 0.0, 0.0, 0.0],  # vue (simpler, less typing needed)
+    [0.0, 0.3, 0.0, 0.0, 0.0, 0.0, 0.5, 0.0, 0.2, 0.0, 0.0],  # typescript
+    [0.4, 0.0, 0.0, 0.0, 0.0, 0.0, 0.6, 0.0, 0.0, 0.0, 0.0],  # python typing (mypy, type hints)
+    [0.2, 0.0, 0.3, 0.4, 0.0, 0.0, 0.0, 0.0, 0.0, 0.1, 0.0],  # ml project
+    [0.4, 0.0, 0.0, 0.0, 0.6, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],  # devops
+    [0.3, 0.0, 0.0, 0.0, 0.3, 0.4, 0.0, 0.0, 0.0, 0.0, 0.0],  # microservices (architecture + backend + cloud)
+    [0.4, 0.4, 0.0, 0.0, 0.0, 0.2, 0.0, 0.0, 0.0, 0.0, 0.0],  # fullstack
+    [0.0, 0.5, 0.0, 0.0, 0.0, 0.2, 0.0, 0.3, 0.0, 0.0, 0.0],  # mobile (frontend fundamentals)
+])
+
+# Capability = inputs @ CAPABILITY_WEIGHTS.T, one row per CapabilityAssessment field
+CAPABILITY_WEIGHTS = np.array([
+    #  be   fe  data   ai cloud arch type lang cplx qual  dev
+    [0.5, 0.0, 0.0, 0.0, 0.0, 0.3, 0.0, 0.0, 0.0, 0.2, 0.0],  # api service
+    [0.4, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.2, 0.4],  # cli tool
+    [0.4, 0.0, 0.4, 0.0, 0.0, 0.2, 0.0, 0.0, 0.0, 0.0, 0.0],  # data pipeline
+    [0.0, 0.0, 0.3, 0.5, 0.0, 0.0, 0.0, 0.0, 0.0, 0.2, 0.0],  # ml model
+    [0.0, 0.7, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.3, 0.0],  # frontend app
+    [0.4, 0.3, 0.0, 0.0, 0.0, 0.3, 0.0, 0.0, 0.0, 0.0, 0.0],  # fullstack app
+    [0.3, 0.0, 0.0, 0.0, 0.5, 0.2, 0.0, 0.0, 0.0, 0.0, 0.0],  # infrastructure
+    [0.4, 0.0, 0.0, 0.0, 0.0, 0.3, 0.0, 0.0, 0.0, 0.0, 0.3],  # plugin system
+])
+
+def _weighted_sums(S: np.ndarray, W: np.ndarray) -> np.ndarray:
+    """
+    S @ W.T, accumulated one input column at a time
+    BLAS reorders the additions depending on batch size, which flips scores
+    sitting on a rounding tie; this keeps single and batch scoring identical
+    """
+    total = np.zeros((S.shape[0], W.shape[0]))
+    for k in range(W.shape[1]):
+        total += S[:, k:k + 1] * W[:, k]
+    return total
+
+def _clip01_r3(x: float) -> float:
+    """Clamp a score to 0-1 and round to 3 places"""
+    return round(0.0 if x < 0.0 else 1.0 if x > 1.0 else x, 3)
+
+def _fields(obj) -> dict[str, float]:
+    """Field dict of a flat slotted dataclass (no __dict__, and asdict deep-copies)"""
+    return {name: getattr(obj, name) for name in obj.__slots__}
+
+def _bar(score: float) -> str:
+    """Precomputed report bar for a 0-1 score"""
+    return _BARS[min(max(int(score * 20), 0), 20)]
+
+@dataclass(slots=True, frozen=True)
 class SkillVector:
     """Normalized skill scores across domains"""
     backend: float
@@ -13,7 +146,7 @@ class SkillVector:
     cloud_infrastructure: float
     architecture: float
     
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CodeStyleProfile:
     """Code style and approach inferred from language choices"""
     type_safety_preference: float  # TypeScript, typed Python usage
@@ -21,7 +154,7 @@ class CodeStyleProfile:
     language_diversity: float  # Number of languages normalized
     complexity_tolerance: float  # Based on repo size and depth
     
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FrictionProfile:
     """Friction scores for various technologies/patterns"""
     react_friction: float
@@ -34,7 +167,7 @@ class FrictionProfile:
     fullstack_friction: float
     mobile_friction: float
     
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CapabilityAssessment:
     """Success likelihood for different project types"""
     api_service: float
@@ -50,51 +183,52 @@ class DivergencePredictiveModel:
     def __init__(self, translated_file: str):
         self.translated_file = translated_file
         self.data = None
+        self.libs_lower = frozenset()
+        self._reset_cache()
+    
+    def _reset_cache(self):
+        """Forget derived scores; each is computed once per loaded profile"""
+        self._skill_vector = None
+        self._code_style = None
+        self._devtools_skill = None
         
     def load_data(self):
         """Load translated profile data"""
-        with open(self.translated_file, 'r', encoding='utf-8') as f:
-            self.data = json.load(f)
+        with open(self.translated_file, 'rb') as f:
+            self.data = orjson.loads(f.read())
+        
+        # Library names lowercased once, as a set for the indicator intersections below
+        self.libs_lower = frozenset(lib.lower() for lib in self.data.get('libraries', {}))
+        self._extract_vectors()
+        self._reset_cache()
+    
+    def _extract_vectors(self):
+        """Pull the nested scores the models read out of self.data once"""
+        comp = self.data['composition']
+        skills = self.data['skills']
+        depth = self.data['technical_depth']
+        langs = self.data['languages']
+        
+        self._comp_backend = comp['backend']
+        self._comp_frontend = comp['frontend']
+        self._comp_data = comp['data']
+        self._data_engineering = skills.get('data_engineering', 0)
+        self._ai_ml = skills.get('ai_ml', 0)
+        self._cloud_devops = skills.get('cloud_devops', 0)
+        self._quality_score = self.data['quality']['quality_score']
+        self._depth_score = depth['depth_score']
+        self._avg_repo_size = depth['avg_repo_size']
+        self._total_repos = self.data['metadata']['total_repositories']
+        
+        # Language shares (percentages) aggregated once
+        self._python_pct = langs.get('Python', 0) / 100
+        self._frontend_lang_pct = sum(langs.get(lang, 0) for lang in FRONTEND_LANGUAGES) / 100
+        self._ts_pct = langs.get('TypeScript', 0)
+        self._lang_count = sum(1 for pct in langs.values() if pct > 1)
     
     def _detect_library_category(self, lib_name: str) -> str:
         """Categorize a library by its purpose"""
-        lib = lib_name.lower()
-        
-        # AI/ML libraries
-        if lib in ['openai', 'anthropic', 'transformers', 'pytorch', 'tensorflow', 
-                   'sklearn', 'keras', 'langchain']:
-            return 'ai_ml'
-        
-        # Data processing
-        if lib in ['pandas', 'numpy', 'scipy', 'polars', 'dask']:
-            return 'data_processing'
-        
-        # Web frameworks
-        if lib in ['flask', 'django', 'fastapi', 'express', 'react', 'vue', 'angular']:
-            return 'web_framework'
-        
-        # DevOps/Infrastructure
-        if lib in ['docker', 'kubernetes', 'terraform', 'ansible']:
-            return 'devops'
-        
-        # Testing
-        if lib in ['pytest', 'unittest', 'jest', 'mocha', 'cypress']:
-            return 'testing'
-        
-        # CLI/Tooling - KEY INDICATORS FOR DEVTOOLS SKILL
-        if lib in ['argparse', 'click', 'typer', 'rich', 'colorama', 'prompt-toolkit']:
-            return 'cli_tool'
-        
-        # Async/Concurrency
-        if lib in ['asyncio', 'aiohttp', 'celery', 'threading']:
-            return 'async'
-        
-        # Data structures (advanced Python usage)
-        if lib in ['collections', 'itertools', 'functools', 'heapq', 'deque', 
-                   'counter', 'lru_cache', 'cache']:
-            return 'advanced_python'
-        
-        return 'other'
+        return LIBRARY_CATEGORIES.get(lib_name.lower(), 'other')
     
     def _infer_devtools_skill(self) -> float:
         """
@@ -104,27 +238,25 @@ class DivergencePredictiveModel:
         3. Advanced Python patterns (decorators, data structures)
         4. Language diversity (polyglot developers build more tools)
         """
-        libs = self.data.get('libraries', {})
-        quality = self.data['quality']
+        if self._devtools_skill is not None:
+            return self._devtools_skill
+        
+        libs = self.libs_lower
         
-        # Check for CLI tooling libraries
-        cli_indicators = {'argparse', 'click', 'typer', 'rich', 'colorama'}
-        has_cli_tools = sum(1 for lib in libs.keys() if lib.lower() in cli_indicators)
+        # CLI tooling libraries
+        has_cli_tools = len(libs & CLI_INDICATORS)
         cli_score = min(has_cli_tools / 2, 1.0)  # Normalize to 0-1
         
-        # Check for advanced Python patterns (indicates tool-building)
-        advanced_indicators = {'functools', 'itertools', 'collections', 'heapq', 
-                              'lru_cache', 'cache', 'deque'}
-        has_advanced = sum(1 for lib in libs.keys() if lib.lower() in advanced_indicators)
+        # Advanced Python patterns (indicates tool-building)
+        has_advanced = len(libs & ADVANCED_INDICATORS)
         advanced_score = min(has_advanced / 4, 1.0)
         
         # Testing sophistication (pytest is a devtool)
-        testing_indicators = {'pytest', 'unittest', 'mock'}
-        has_testing = sum(1 for lib in libs.keys() if lib.lower() in testing_indicators)
+        has_testing = len(libs & TESTING_INDICATORS)
         testing_score = min(has_testing / 2, 1.0)
         
         # Quality discipline (good devtools have good tests)
-        quality_score = quality['quality_score']
+        quality_score = self._quality_score
         
         # Combine signals
         devtools_skill = (
@@ -134,101 +266,115 @@ class DivergencePredictiveModel:
             quality_score * 0.15
         )
         
-        return round(devtools_skill, 3)
+        self._devtools_skill = round(devtools_skill, 3)
+        return self._devtools_skill
     
     def compute_skill_vector(self) -> SkillVector:
         """
         Synthesize normalized skill scores from available data
         No time-series or commit patterns - only static analysis
         """
-        comp = self.data['composition']
-        langs = self.data['languages']
-        skills = self.data['skills']
-        quality = self.data['quality']
-        depth = self.data['technical_depth']
-        libs = self.data.get('libraries', {})
+        if self._skill_vector is not None:
+            return self._skill_vector
+        
+        libs = self.libs_lower
         
         # Backend skill (Python + backend composition + quality)
-        python_strength = langs.get('Python', 0) / 100
+        python_strength = self._python_pct
         backend = (
-            comp['backend'] * 0.5 +
+            self._comp_backend * 0.5 +
             python_strength * 0.3 +
-            quality['quality_score'] * 0.2
+            self._quality_score * 0.2
         )
         
         # Frontend skill (JS/TS + HTML/CSS)
-        frontend_langs = (
-            langs.get('JavaScript', 0) +
-            langs.get('TypeScript', 0) +
-            langs.get('HTML', 0) +
-            langs.get('CSS', 0)
-        ) / 100
-        frontend = comp['frontend'] * 0.7 + frontend_langs * 0.3
+        frontend_langs = self._frontend_lang_pct
+        frontend = self._comp_frontend * 0.7 + frontend_langs * 0.3
         
         # Data skill (data composition + data engineering)
         data = (
-            comp['data'] * 0.5 +
-            skills.get('data_engineering', 0) * 0.5
+            self._comp_data * 0.5 +
+            self._data_engineering * 0.5
         )
         
         # AI/ML skill (from skills + OpenAI/Anthropic library usage)
-        has_ai_libs = any(lib.lower() in ['openai', 'anthropic', 'langchain'] 
-                         for lib in libs.keys())
-        ai_ml = skills.get('ai_ml', 0) + (0.2 if has_ai_libs else 0)
+        has_ai_libs = not AI_LIBS.isdisjoint(libs)
+        ai_ml = self._ai_ml + (0.2 if has_ai_libs else 0)
         
         # Cloud/Infrastructure
-        cloud = skills.get('cloud_devops', 0)
+        cloud = self._cloud_devops
         
         # Architecture skill (inferred from depth + size + quality)
         # Large, well-tested projects indicate architectural experience
         architecture = (
-            depth['depth_score'] * 0.5 +
-            quality['quality_score'] * 0.3 +
-            min(depth['avg_repo_size'] / 2000, 1.0) * 0.2
+            self._depth_score * 0.5 +
+            self._quality_score * 0.3 +
+            min(self._avg_repo_size / 2000, 1.0) * 0.2
         )
         
-        return SkillVector(
-            backend=round(min(backend, 1.0), 3),
-            frontend=round(min(frontend, 1.0), 3),
-            data=round(min(data, 1.0), 3),
-            ai_ml=round(min(ai_ml, 1.0), 3),
-            cloud_infrastructure=round(cloud, 3),
-            architecture=round(min(architecture, 1.0), 3)
+        # Positional, in SkillVector field order
+        self._skill_vector = SkillVector(
+            _clip01_r3(backend),
+            _clip01_r3(frontend),
+            _clip01_r3(data),
+            _clip01_r3(ai_ml),
+            round(cloud, 3),
+            _clip01_r3(architecture)
         )
+        return self._skill_vector
     
     def compute_code_style_profile(self) -> CodeStyleProfile:
         """
         Analyze coding style preferences from language usage
         """
-        langs = self.data['languages']
-        depth = self.data['technical_depth']
-        libs = self.data.get('libraries', {})
+        if self._code_style is not None:
+            return self._code_style
+        
+        libs = self.libs_lower
         
         # Type safety preference (TypeScript + typed Python indicators)
-        ts_usage = langs.get('TypeScript', 0)
-        has_typing = any(lib.lower() in ['typing', 'mypy', 'pydantic'] 
-                        for lib in libs.keys())
+        ts_usage = self._ts_pct
+        has_typing = not TYPING_LIBS.isdisjoint(libs)
         type_safety = (ts_usage / 50 + (0.3 if has_typing else 0))
         
         # Functional vs OOP (based on library patterns)
         functional_libs = {'functools', 'itertools', 'map', 'filter', 'reduce'}
         oop_libs = {'class', 'inheritance', 'polymorphism'}
-        func_count = sum(1 for lib in libs.keys() if lib.lower() in functional_libs)
+        func_count = len(libs & functional_libs)
         functional_vs_oop = 0.3 if func_count > 2 else 0.7  # 0=functional, 1=OOP
         
         # Language diversity (polyglot tendency)
-        lang_count = len([v for v in langs.values() if v > 1])
+        lang_count = self._lang_count
         language_diversity = min(lang_count / 6, 1.0)
         
         # Complexity tolerance (large repos = comfortable with complexity)
-        complexity_tolerance = depth['depth_score']
-        
-        return CodeStyleProfile(
-            type_safety_preference=round(min(type_safety, 1.0), 3),
-            functional_vs_oop=round(functional_vs_oop, 3),
-            language_diversity=round(language_diversity, 3),
-            complexity_tolerance=round(complexity_tolerance, 3)
+        complexity_tolerance = self._depth_score
+        
+        # Positional, in CodeStyleProfile field order
+        self._code_style = CodeStyleProfile(
+            _clip01_r3(type_safety),
+            round(functional_vs_oop, 3),
+            round(language_diversity, 3),
+            round(complexity_tolerance, 3)
         )
+        return self._code_style
+    
+    def _score_inputs(self, skill_vector: SkillVector,
+                      code_style: CodeStyleProfile) -> np.ndarray:
+        """Pack the scoring inputs in SCORE_INPUTS column order"""
+        return np.array([
+            skill_vector.backend,
+            skill_vector.frontend,
+            skill_vector.data,
+            skill_vector.ai_ml,
+            skill_vector.cloud_infrastructure,
+            skill_vector.architecture,
+            code_style.type_safety_preference,
+            code_style.language_diversity,
+            code_style.complexity_tolerance,
+            self._quality_score,
+            self._infer_devtools_skill(),
+        ])
     
     def compute_friction_profile(self, skill_vector: SkillVector, 
                                  code_style: CodeStyleProfile) -> FrictionProfile:
@@ -236,83 +382,9 @@ class DivergencePredictiveModel:
         Calculate friction without behavioral/temporal data
         Based purely on current skill levels and style preferences
         """
-        langs = self.data['languages']
-        
-        # Type safety experience (for typed frameworks)
-        type_experience = code_style.type_safety_preference
-        
-        # React friction (needs frontend + type safety + complexity)
-        react_friction = 1 - (
-            skill_vector.frontend * 0.4 +
-            type_experience * 0.3 +
-            code_style.complexity_tolerance * 0.3
-        )
-        
-        # Vue friction (simpler, less typing needed)
-        vue_friction = 1 - (
-            skill_vector.frontend * 0.6 +
-            code_style.language_diversity * 0.4
-        )
-        
-        # TypeScript friction
-        typescript_friction = 1 - (
-            type_experience * 0.5 +
-            skill_vector.frontend * 0.3 +
-            code_style.complexity_tolerance * 0.2
-        )
-        
-        # Python typing friction (mypy, type hints)
-        python_typing_friction = 1 - (
-            type_experience * 0.6 +
-            skill_vector.backend * 0.4
-        )
-        
-        # ML project friction
-        ml_project_friction = 1 - (
-            skill_vector.ai_ml * 0.4 +
-            skill_vector.data * 0.3 +
-            skill_vector.backend * 0.2 +
-            self.data['quality']['quality_score'] * 0.1
-        )
-        
-        # DevOps friction
-        devops_friction = 1 - (
-            skill_vector.cloud_infrastructure * 0.6 +
-            skill_vector.backend * 0.4
-        )
-        
-        # Microservices friction (needs architecture + backend + cloud)
-        microservices_friction = 1 - (
-            skill_vector.architecture * 0.4 +
-            skill_vector.backend * 0.3 +
-            skill_vector.cloud_infrastructure * 0.3
-        )
-        
-        # Fullstack friction
-        fullstack_friction = 1 - (
-            skill_vector.frontend * 0.4 +
-            skill_vector.backend * 0.4 +
-            skill_vector.architecture * 0.2
-        )
-        
-        # Mobile friction (needs frontend fundamentals)
-        mobile_friction = 1 - (
-            skill_vector.frontend * 0.5 +
-            code_style.language_diversity * 0.3 +
-            skill_vector.architecture * 0.2
-        )
-        
-        return FrictionProfile(
-            react_friction=round(max(react_friction, 0), 3),
-            vue_friction=round(max(vue_friction, 0), 3),
-            typescript_friction=round(max(typescript_friction, 0), 3),
-            python_typing_friction=round(max(python_typing_friction, 0), 3),
-            ml_project_friction=round(max(ml_project_friction, 0), 3),
-            devops_friction=round(max(devops_friction, 0), 3),
-            microservices_friction=round(max(microservices_friction, 0), 3),
-            fullstack_friction=round(max(fullstack_friction, 0), 3),
-            mobile_friction=round(max(mobile_friction, 0), 3)
-        )
+        inputs = self._score_inputs(skill_vector, code_style)[np.newaxis]
+        friction = 1 - _weighted_sums(inputs, FRICTION_WEIGHTS)[0]
+        return FrictionProfile(*map(_clip01_r3, friction.tolist()))
     
     def compute_capability_assessment(self, skill_vector: SkillVector,
                                       code_style: CodeStyleProfile) -> CapabilityAssessment:
@@ -320,83 +392,48 @@ class DivergencePredictiveModel:
         Predict success likelihood for project types
         Based on skill match, no temporal factors
         """
-        quality = self.data['quality']['quality_score']
-        
-        # API service (backend + architecture + quality)
-        api_service = (
-            skill_vector.backend * 0.5 +
-            skill_vector.architecture * 0.3 +
-            quality * 0.2
-        )
-        
-        # CLI tool (backend + code quality)
-        devtools_skill = self._infer_devtools_skill()
-        cli_tool = (
-            skill_vector.backend * 0.4 +
-            devtools_skill * 0.4 +
-            quality * 0.2
-        )
-        
-        # Data pipeline (data + backend + architecture)
-        data_pipeline = (
-            skill_vector.data * 0.4 +
-            skill_vector.backend * 0.4 +
-            skill_vector.architecture * 0.2
-        )
-        
-        # ML model (AI/ML + data + quality)
-        ml_model = (
-            skill_vector.ai_ml * 0.5 +
-            skill_vector.data * 0.3 +
-            quality * 0.2
-        )
-        
-        # Frontend app (frontend + quality)
-        frontend_app = (
-            skill_vector.frontend * 0.7 +
-            quality * 0.3
-        )
-        
-        # Fullstack app (both + architecture)
-        fullstack_app = (
-            skill_vector.frontend * 0.3 +
-            skill_vector.backend * 0.4 +
-            skill_vector.architecture * 0.3
-        )
-        
-        # Infrastructure (cloud + backend + architecture)
-        infrastructure = (
-            skill_vector.cloud_infrastructure * 0.5 +
-            skill_vector.backend * 0.3 +
-            skill_vector.architecture * 0.2
-        )
-        
-        # Plugin system (backend + architecture + devtools)
-        plugin_system = (
-            skill_vector.backend * 0.4 +
-            skill_vector.architecture * 0.3 +
-            devtools_skill * 0.3
-        )
-        
-        return CapabilityAssessment(
-            api_service=round(min(api_service, 1.0), 3),
-            cli_tool=round(min(cli_tool, 1.0), 3),
-            data_pipeline=round(min(data_pipeline, 1.0), 3),
-            ml_model=round(min(ml_model, 1.0), 3),
-            frontend_app=round(min(frontend_app, 1.0), 3),
-            fullstack_app=round(min(fullstack_app, 1.0), 3),
-            infrastructure=round(min(infrastructure, 1.0), 3),
-            plugin_system=round(min(plugin_system, 1.0), 3)
-        )
+        inputs = self._score_inputs(skill_vector, code_style)[np.newaxis]
+        capability = _weighted_sums(inputs, CAPABILITY_WEIGHTS)[0]
+        return CapabilityAssessment(*map(_clip01_r3, capability.tolist()))
     
-    def identify_skill_gaps(self, skill_vector: SkillVector) -> Dict[str, float]:
-        """Identify low-scoring areas (potential growth zones)"""
-        skills_dict = asdict(skill_vector)
+    @classmethod
+    def compute_batch(cls, translated_files: list[str]) -> list[tuple[FrictionProfile, CapabilityAssessment]]:
+        """
+        Friction and capability for many translated profiles in one pass
+        Stacks every profile's score inputs and scores them all at once
+        """
+        rows = []
+        for translated_file in translated_files:
+            model = cls(translated_file)
+            model.load_data()
+            rows.append(model._score_inputs(model.compute_skill_vector(),
+                                            model.compute_code_style_profile()))
+        if not rows:
+            return []
+        
+        S = np.vstack(rows)
+        if compute_all_numba is not None:
+            friction, capability = compute_all_numba(S, FRICTION_WEIGHTS, CAPABILITY_WEIGHTS)
+        else:
+            friction = 1 - _weighted_sums(S, FRICTION_WEIGHTS)
+            capability = _weighted_sums(S, CAPABILITY_WEIGHTS)
+        
+        return [
+            (FrictionProfile(*map(_clip01_r3, f_row)),
+             CapabilityAssessment(*map(_clip01_r3, c_row)))
+            for f_row, c_row in zip(friction.tolist(), capability.tolist())
+        ]
+    
+    def identify_skill_gaps(self, skill_vector: SkillVector, top_k: int = None) -> dict[str, float]:
+        """Identify low-scoring areas (potential growth zones), largest gap first; top_k limits the count"""
+        skills_dict = _fields(skill_vector)
         gaps = {k: round(1.0 - v, 3) for k, v in skills_dict.items() if v < 0.5}
+        if top_k is not None:
+            return dict(heapq.nlargest(top_k, gaps.items(), key=lambda x: x[1]))
         return dict(sorted(gaps.items(), key=lambda x: x[1], reverse=True))
     
     def recommend_learning_path(self, skill_vector: SkillVector,
-                                friction: FrictionProfile) -> List[Dict[str, any]]:
+                                friction: FrictionProfile) -> list[dict[str, any]]:
         """Suggest technologies based on current profile and friction"""
         recommendations = []
         
@@ -438,10 +475,10 @@ class DivergencePredictiveModel:
     
     def predict_project_success(self, project_type: str,
                                capabilities: CapabilityAssessment,
-                               friction: FrictionProfile) -> Dict[str, any]:
+                               friction: FrictionProfile) -> dict[str, any]:
         """Predict project success and identify risks"""
-        cap_dict = asdict(capabilities)
-        friction_dict = asdict(friction)
+        cap_dict = _fields(capabilities)
+        friction_dict = _fields(friction)
         
         success_score = cap_dict.get(project_type, 0.5)
         
@@ -470,7 +507,7 @@ class DivergencePredictiveModel:
             tensions.append(f'Low capability match ({success_score:.2f}) - significant skill gap')
         if relevant_friction > 0.6:
             tensions.append(f'High friction ({relevant_friction:.2f}) - steep learning curve')
-        if self.data['quality']['quality_score'] < 0.5:
+        if self._quality_score < 0.5:
             tensions.append('Low test coverage may impact production quality')
         
         return {
@@ -479,10 +516,11 @@ class DivergencePredictiveModel:
             'friction_score': round(relevant_friction, 3),
             'risk_level': risk,
             'tension_points': tensions,
-            'skill_gaps': self._identify_project_gaps(project_type, asdict(self.compute_skill_vector()))
+            # Cached from generate_predictive_profile, not recomputed
+            'skill_gaps': self._identify_project_gaps(project_type, _fields(self.compute_skill_vector()))
         }
     
-    def _identify_project_gaps(self, project_type: str, skills: Dict) -> List[str]:
+    def _identify_project_gaps(self, project_type: str, skills: dict) -> list[str]:
         """Identify specific skill gaps for a project type"""
         gaps = []
         
@@ -499,7 +537,7 @@ class DivergencePredictiveModel:
         
         return gaps
     
-    def generate_predictive_profile(self) -> Dict:
+    def generate_predictive_profile(self) -> dict:
         """Generate complete predictive profile"""
         self.load_data()
         
@@ -512,16 +550,16 @@ class DivergencePredictiveModel:
         devtools_skill = self._infer_devtools_skill()
         
         return {
-            'skill_vector': asdict(skill_vector),
-            'code_style_profile': asdict(code_style),
-            'friction_profile': asdict(friction),
-            'capability_assessment': asdict(capabilities),
+            'skill_vector': _fields(skill_vector),
+            'code_style_profile': _fields(code_style),
+            'friction_profile': _fields(friction),
+            'capability_assessment': _fields(capabilities),
             'skill_gaps': skill_gaps,
             'learning_recommendations': learning_path,
             'devtools_skill': devtools_skill,
             'metadata': {
                 'model_version': '2.0.0',
-                'based_on_repos': self.data['metadata']['total_repositories'],
+                'based_on_repos': self._total_repos,
                 'data_source': 'static_analysis_only',
                 'analysis_timestamp': self.data['metadata']['analysis_timestamp']
             }
@@ -531,53 +569,54 @@ class DivergencePredictiveModel:
         """Save predictive profile with visual summary"""
         profile = self.generate_predictive_profile()
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(profile, f, indent=2)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(profile, option=orjson.OPT_INDENT_2))
         
-        print(f"\n{'='*70}")
-        print("DIVERGENCE PREDICTIVE PROFILE")
-        print(f"{'='*70}\n")
+        # Build the whole report, then write it to stdout once
+        lines = []
+        lines.append(f"\n{'='*70}")
+        lines.append("DIVERGENCE PREDICTIVE PROFILE")
+        lines.append(f"{'='*70}\n")
         
-        print("SKILL VECTOR:")
+        lines.append("SKILL VECTOR:")
         for skill, score in profile['skill_vector'].items():
-            bar = '█' * int(score * 20)
-            print(f"  {skill:.<30} {score:.3f} {bar}")
+            bar = _bar(score)
+            lines.append(f"  {skill:.<30} {score:.3f} {bar}")
         
-        print(f"\n  {'devtools (inferred)':.<30} {profile['devtools_skill']:.3f} {'█' * int(profile['devtools_skill'] * 20)}")
+        lines.append(f"\n  {'devtools (inferred)':.<30} {profile['devtools_skill']:.3f} {_bar(profile['devtools_skill'])}")
         
-        print("\nCODE STYLE PROFILE:")
+        lines.append("\nCODE STYLE PROFILE:")
         for trait, score in profile['code_style_profile'].items():
-            bar = '█' * int(score * 20)
-            print(f"  {trait:.<30} {score:.3f} {bar}")
+            bar = _bar(score)
+            lines.append(f"  {trait:.<30} {score:.3f} {bar}")
         
-        print("\nFRICTION PROFILE (lower = easier):")
+        lines.append("\nFRICTION PROFILE (lower = easier):")
         for tech, friction in profile['friction_profile'].items():
-            bar = '█' * int(friction * 20)
+            bar = _bar(friction)
             color = '🟢' if friction < 0.3 else '🟡' if friction < 0.6 else '🔴'
-            print(f"  {color} {tech:.<28} {friction:.3f} {bar}")
+            lines.append(f"  {color} {tech:.<28} {friction:.3f} {bar}")
         
-        print("\nCAPABILITY ASSESSMENT:")
+        lines.append("\nCAPABILITY ASSESSMENT:")
         for proj, score in profile['capability_assessment'].items():
-            bar = '█' * int(score * 20)
+            bar = _bar(score)
             color = '✓' if score > 0.7 else '~' if score > 0.4 else '✗'
-            print(f"  {color} {proj:.<28} {score:.3f} {bar}")
+            lines.append(f"  {color} {proj:.<28} {score:.3f} {bar}")
         
         if profile['skill_gaps']:
-            print("\nSKILL GAPS (growth opportunities):")
+            lines.append("\nSKILL GAPS (growth opportunities):")
             for gap, severity in list(profile['skill_gaps'].items())[:3]:
-                print(f"  ⚠️  {gap}: gap of {severity:.3f}")
+                lines.append(f"  ⚠️  {gap}: gap of {severity:.3f}")
         
         if profile['learning_recommendations']:
-            print("\nRECOMMENDED LEARNING PATH:")
+            lines.append("\nRECOMMENDED LEARNING PATH:")
             for rec in profile['learning_recommendations'][:3]:
-                print(f"  📚 {rec['area']}: friction {rec['friction']:.2f}")
-                print(f"     → {', '.join(rec['suggested_tech'])}")
+                lines.append(f"  📚 {rec['area']}: friction {rec['friction']:.2f}")
+                lines.append(f"     → {', '.join(rec['suggested_tech'])}")
         
-        print(f"\nSaved to {output_file}")
+        lines.append(f"\nSaved to {output_file}")
+        sys.stdout.write('\n'.join(lines) + '\n')
 
 if __name__ == '__main__':
-    import sys
-    
     if len(sys.argv) < 2:
         print("Usage: python predictive.py <translated.json> [output_file]")
         sys.exit(1)
@@ -1,70 +1,185 @@
-import json
-from collections import defaultdict
-from datetime import datetime
-import statistics
+import os
+import orjson
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 
+import numpy as np
+
+# File extension -> composition bucket (index into the frontend/backend/data counts)
+FILE_TYPE_BUCKET = {
+    # frontend
+    **dict.fromkeys(['html', 'css', 'scss', 'sass', 'jsx', 'tsx', 'vue'], 0),
+    # backend
+    **dict.fromkeys(['py', 'java', 'go', 'rs', 'rb', 'php', 'js', 'ts'], 1),
+    # data
+    **dict.fromkeys(['sql', 'csv', 'json', 'xml', 'parquet', 'db'], 2),
+}
+
+# Skill area -> lowercase library/framework names that indicate it
+SKILL_INDICATORS = {
+    'ai_ml': frozenset({
+        'tensorflow', 'pytorch', 'keras', 'sklearn', 'scikit-learn',
+        'pandas', 'numpy', 'scipy', 'transformers', 'langchain'
+    }),
+    'web_development': frozenset({
+        'react', 'vue', 'angular', 'express', 'django', 'flask',
+        'fastapi', 'nextjs', 'nestjs', 'rails'
+    }),
+    'mobile_development': frozenset({
+        'react-native', 'flutter', 'swift', 'kotlin', 'ionic'
+    }),
+    'cloud_devops': frozenset({
+        'docker', 'kubernetes', 'terraform', 'aws', 'azure', 'gcp',
+        'ansible', 'jenkins', 'github-actions'
+    }),
+    'data_engineering': frozenset({
+        'spark', 'hadoop', 'airflow', 'kafka', 'dask', 'beam'
+    }),
+    'cybersecurity': frozenset({
+        'cryptography', 'pycrypto', 'requests', 'scapy', 'nmap'
+    }),
+}
+
+# filtered.json path -> (file key, serialized profile) for profiles translated from disk
+_TRANSLATE_CACHE = {}
+
+# Bump whenever the profile aggregation changes, so sidecars from older versions are ignored
+CACHE_FORMAT_VERSION = 1
+
+def _file_key(path):
+    """Changes whenever the file is rewritten or replaced, or the cache format version changes"""
+    stat = path.stat()
+    return [CACHE_FORMAT_VERSION, stat.st_mtime_ns, stat.st_size, stat.st_ino]
+
+def _sidecar(path):
+    return path.with_name(f'.{path.name}.translated.cache')
+
+def _cached_profile(path, key):
+    """Serialized profile for this version of the file, from memory or the on-disk sidecar"""
+    entry = _TRANSLATE_CACHE.get(path)
+    if entry is not None and entry[0] == key:
+        return entry[1]
+    try:
+        # Sidecar: the file key (format version first) on the first line, the profile after it
+        stored_key, _, blob = _sidecar(path).read_bytes().partition(b'\n')
+        if orjson.loads(stored_key) != key:
+            return None
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    _TRANSLATE_CACHE[path] = (key, blob)
+    return blob
+
+def _store_profile(path, key, profile):
+    blob = orjson.dumps(profile)
+    _TRANSLATE_CACHE[path] = (key, blob)
+    try:
+        _sidecar(path).write_bytes(orjson.dumps(key) + b'\n' + blob)
+    except OSError:
+        pass  # read-only input directory: keep the in-process cache only
+
 class DeveloperProfile1: 
     def __init__(self, filtered_file):
         self.filtered_file = filtered_file
         self.data = None
     def load_filtereddata(self):
-        with open (self.filtered_file, 'r', encoding='utf-8') as f:
-            self.data = json.load(f)
+        self.data = orjson.loads(Path(self.filtered_file).read_bytes())
     
-    def language_aggregation(self):
+    def _accumulate(self):
+        """Walk the repositories once, collecting the raw totals every aggregation below reads"""
         count_lang = defaultdict(int)
-
-        #counting language usage throughout each repo
+        lib_count = Counter()
+        frame_count = Counter()
+        repo_count = 0
+        size_total = 0
+        size_max = 0
+        coverage_total = 0
+        type_counts = [0, 0, 0]  # frontend, backend, data
+        all_libs = set()
+        all_frameworks = set()
+        
         for repo in self.data['repositories']:
+            #counting language usage throughout each repo
             # Handle both dict and non-dict language formats
-            if isinstance(repo.get('languages'), dict):
-                for lang, count in repo['languages'].items():
-                    count_lang[lang] += int(count)
-            elif isinstance(repo.get('languages'), list):
-                for lang in repo['languages']:
+            languages = repo.get('languages')
+            if isinstance(languages, dict):
+                for lang, count in languages.items():
+                    # filtering writes ints; only coerce stringified/float counts
+                    count_lang[lang] += count if type(count) is int else int(count)
+            elif isinstance(languages, list):
+                for lang in languages:
                     count_lang[lang] += 1
+            
+            # Counter's C counting loop; iter() so a {name: count} libraries
+            # dict still counts each library once per repo
+            lib_count.update(iter(repo['libraries']))
+            frame_count.update(iter(repo['frameworks']))
+            
+            repo_count += 1
+            size = repo['size_kb']
+            size_total += size
+            if size > size_max:
+                size_max = size
+            
+            # Most recorded file types are not in any bucket; intersecting the key
+            # views in C leaves only the known extensions to look up
+            file_types = repo['file_types']
+            for file_type in file_types.keys() & FILE_TYPE_BUCKET.keys():
+                type_counts[FILE_TYPE_BUCKET[file_type]] += file_types[file_type]
+            
+            all_libs.update(map(str.lower, repo['libraries']))
+            all_frameworks.update(map(str.lower, repo['frameworks']))
+            
+            coverage_total += repo['test_coverage']
         
-        total = sum(count_lang.values())
+        self._lang_count = count_lang
+        self._lib_count = lib_count
+        self._frame_count = frame_count
+        self._repo_count = repo_count
+        self._size_total = size_total
+        self._size_max = size_max
+        self._coverage_total = coverage_total
+        self._fe_count, self._be_count, self._data_count = type_counts
+        self._libs_lower = all_libs
+        self._fws_lower = all_frameworks
+    
+    def language_aggregation(self):
+        count_lang = self._lang_count
+        counts = np.fromiter(count_lang.values(), dtype=np.float64, count=len(count_lang))
+        total = counts.sum()
 
         #edge case: user does not use any language in repo
         if total == 0:
             return {}
         
-        return {lang: round((count/total)*100, 2) for lang, count in count_lang.items()}\
+        # percentages divided and rounded as one array op
+        return dict(zip(count_lang, np.round(counts / total * 100, 2).tolist()))
     
-    def library_aggregation(self):
-        lib_count = defaultdict(int)
-
-        for repo in self.data["repositories"]:
-            for lib in repo['libraries']:
-                lib_count[lib] += 1
+    @staticmethod
+    def _count_items(counts):
+        """Accumulated repo counts as a dict sorted by frequency, most used first"""
+        sorted_items = sorted(counts.items(), key=itemgetter(1), reverse=True)
 
-        #libraries sorted by frequency
-        sorted_lib = sorted(lib_count.items(), key = lambda x:x[1], reverse=True)
-
-        return {lib: count for lib, count in sorted_lib}
+        return dict(sorted_items)
+    
+    def library_aggregation(self):
+        return self._count_items(self._lib_count)
     
     def framework_aggregation(self):
-        frame_count = defaultdict(int)
-
-        for repo in self.data["repositories"]:
-            for frame in repo['frameworks']:
-                frame_count[frame] += 1
-        
-        sorted_frames = sorted(frame_count.items(), key = lambda x:x[1], reverse=True)
+        return self._count_items(self._frame_count)
 
     def analytical_depth(self):
-        repo_sizes = [repo['size_kb'] for repo in self.data['repositories']]
-        if not repo_sizes:
+        if not self._repo_count:
             return {
                 'depth_score' : 0.0,
                 'avg_repo_size_kb' : 0.0,
                 'level': 'beginner'
             }
-        avg_size = statistics.mean(repo_sizes)
+        avg_size = self._size_total / self._repo_count
         depth_score = min(avg_size/500, 1.0)
-        max_size = max(repo_sizes) 
+        max_size = self._size_max
 
         if depth_score > 0.7:
             level = 'advanced'
@@ -80,22 +195,9 @@ class DeveloperProfile1:
                 }
     
     def composition(self):
-        frontend_types = {'html', 'css', 'scss', 'sass', 'jsx', 'tsx', 'vue'}
-        backend_types = {'py', 'java', 'go', 'rs', 'rb', 'php', 'js', 'ts'}
-        data_types = {'sql', 'csv', 'json', 'xml', 'parquet', 'db'}
-        
-        frontend_count = 0
-        backend_count = 0
-        data_count = 0
-
-        for repo in self.data['repositories']:
-            for file_type, count in repo['file_types'].items():
-                if file_type in frontend_types:
-                    frontend_count += count
-                if file_type in backend_types:
-                    backend_count += count
-                if file_type in data_types:
-                    data_count += count
+        frontend_count = self._fe_count
+        backend_count = self._be_count
+        data_count = self._data_count
         
         total = frontend_count + backend_count + data_count
         if total == 0:
@@ -113,62 +215,22 @@ class DeveloperProfile1:
     
     def skills(self):
         skills = defaultdict(float)
+        combined = self._libs_lower | self._fws_lower
         
-        ai_ml_indicators = {
-            'tensorflow', 'pytorch', 'keras', 'sklearn', 'scikit-learn',
-            'pandas', 'numpy', 'scipy', 'transformers', 'langchain'
-        }
-        
-        web_dev_indicators = {
-            'react', 'vue', 'angular', 'express', 'django', 'flask',
-            'fastapi', 'nextjs', 'nestjs', 'rails'
-        }
-        
-        mobile_indicators = {
-            'react-native', 'flutter', 'swift', 'kotlin', 'ionic'
-        }
-        
-        cloud_devops_indicators = {
-            'docker', 'kubernetes', 'terraform', 'aws', 'azure', 'gcp',
-            'ansible', 'jenkins', 'github-actions'
-        }
-        
-        data_engineering_indicators = {
-            'spark', 'hadoop', 'airflow', 'kafka', 'dask', 'beam'
-        }
-        
-        cybersecurity_indicators = {
-            'cryptography', 'pycrypto', 'requests', 'scapy', 'nmap'
-        }
-        
-        all_libs = set()
-        all_frameworks = set()
-        
-        for repo in self.data['repositories']:
-            all_libs.update([lib.lower() for lib in repo['libraries']])
-            all_frameworks.update([fw.lower() for fw in repo['frameworks']])
-        
-        combined = all_libs | all_frameworks
-        
-        # score each skill area
-        skills['ai_ml'] = round(len(combined & ai_ml_indicators) / len(ai_ml_indicators), 3)
-        skills['web_development'] = round(len(combined & web_dev_indicators) / len(web_dev_indicators), 3)
-        skills['mobile_development'] = round(len(combined & mobile_indicators) / len(mobile_indicators), 3)
-        skills['cloud_devops'] = round(len(combined & cloud_devops_indicators) / len(cloud_devops_indicators), 3)
-        skills['data_engineering'] = round(len(combined & data_engineering_indicators) / len(data_engineering_indicators), 3)
-        skills['cybersecurity'] = round(len(combined & cybersecurity_indicators) / len(cybersecurity_indicators), 3)
+        # score each skill area; probe the small indicator sets against combined
+        # rather than building an intersection set per category
+        for skill, indicators in SKILL_INDICATORS.items():
+            skills[skill] = round(sum(1 for x in indicators if x in combined) / len(indicators), 3)
         
         return skills
     
     def quality(self):
-        coverage_values = [repo['test_coverage'] for repo in self.data['repositories']]
-        if not coverage_values:
+        if not self._repo_count:
             return {'avg_test_coverage': 0.0,
                 'quality_score': 0.0,
                 'rating': 'unknown'}
         
-        avg_coverage = statistics.mean(coverage_values)
-        max_coverage = max(coverage_values)
+        avg_coverage = self._coverage_total / self._repo_count
         quality_score = min (avg_coverage / 100, 1.0)
 
         if avg_coverage > 70:
@@ -185,7 +247,24 @@ class DeveloperProfile1:
             'rating': rating}
     
     def translate(self):
+        if self.data is not None:
+            return self._assemble_profile()
+        
+        # Translating straight from disk: reuse the earlier profile while the file is unchanged
+        path = Path(self.filtered_file).resolve()
+        key = _file_key(path)
+        cached = _cached_profile(path, key)
+        if cached is not None:
+            return orjson.loads(cached)
+        
         self.load_filtereddata()
+        profile = self._assemble_profile()
+        _store_profile(path, key, profile)
+        return profile
+    
+    def _assemble_profile(self):
+        # One pass over the repositories; the aggregations below only finalize
+        self._accumulate()
         
         profile = {
             'languages': self.language_aggregation(),
@@ -198,7 +277,7 @@ class DeveloperProfile1:
             'metadata': {
                 'total_repositories': len(self.data['repositories']),
                 'total_commits': self.data['total_commits'],
-                'analysis_timestamp': datetime.now().isoformat()
+                'analysis_timestamp': datetime.now(timezone.utc).isoformat()
             }
         }
         
@@ -208,8 +287,8 @@ class DeveloperProfile1:
         #Saving translated profile to JSON file
         profile = self.translate()
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(profile, f, indent=2)
+        # Serialized in C as one buffer, written with a single call
+        Path(output_file).write_bytes(orjson.dumps(profile, option=orjson.OPT_INDENT_2))
         
         print(f"Developer Profile Analysis Complete")
         print(f"Languages: {len(profile['languages'])}")
@@ -218,14 +297,49 @@ class DeveloperProfile1:
               f"Backend: {profile['composition']['backend']}, "
               f"Data: {profile['composition']['data']}")
         print(f"Saved to {output_file}")
+        return profile
+
+def build_profile(filtered_data):
+    """In-process entry point: translate already-loaded filtered data, no file round trip"""
+    translator = DeveloperProfile1(None)
+    translator.data = filtered_data
+    return translator.translate()
+
+def run(filtered_data, output_dir='.'):
+    """Pipeline entry point: translate in-memory filtered data, write translated.json, return the profile"""
+    output_dir = Path(output_dir)
+    translator = DeveloperProfile1(output_dir / 'filtered.json')
+    translator.data = filtered_data
+    return translator.save_to_json(str(output_dir / 'translated.json'))
+
+def _translate_one(filtered_file):
+    """--batch worker: translate one filtered.json into the translated.json beside it"""
+    DeveloperProfile1(filtered_file).save_to_json(str(filtered_file.parent / 'translated.json'))
+    return filtered_file
+
+def run_batch(root):
+    """Translate every <root>/*/filtered.json (one directory per user) across all CPUs"""
+    filtered_files = sorted(Path(root).glob('*/filtered.json'))
+    # Users are independent: JSON parsing and aggregation scale with processes, not threads
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(_translate_one, filtered_files))
 
 if __name__ == '__main__':
     import sys
     
     if len(sys.argv) < 2:
         print("Usage: python translated.py <filtered.json> [output_dir]")
+        print("       python translated.py --batch <dir>   (every <dir>/*/filtered.json)")
         sys.exit(1)
     
+    if sys.argv[1] == '--batch':
+        if len(sys.argv) < 3:
+            print("Usage: python translated.py --batch <dir>")
+            sys.exit(1)
+        translated = run_batch(sys.argv[2])
+        print(f"Translated {len(translated)} profiles under {sys.argv[2]}")
+        sys.exit(0)
+    
     # filtered_file = sys.argv[1]
     
     # received as str now, so convert back to path
@@ -1,36 +1,63 @@
 import asyncio
+import atexit
+import sys
 from motor.motor_asyncio import AsyncIOMotorClient
-import json
+from pymongo import UpdateOne
+from bson import ObjectId
+import orjson
 from pathlib import Path
-from datetime import datetime
-
-async def update_mongo():
-    client = AsyncIOMotorClient('mongodb://localhost:27017')
-    db = client.divergence
-    
-    user_id = '696c8e2f04fdddb47db2f16a'
-    
-    # Load filtered data
-    filtered_data = json.loads((Path('translation') / user_id / 'filtered.json').read_text())
-    
-    # Update MongoDB
-    result = await db.github_data_collection.update_one(
-        {'user_id': user_id},
-        {
-            '$set': {
-                'user_id': user_id,
-                'username': 'GitShard1',
-                'filtered_data': filtered_data,
-                'processed_at': datetime.utcnow()
-            }
-        },
-        upsert=True
-    )
-    
-    print('✓ Updated MongoDB with new filtered data')
-    print(f'  Matched: {result.matched_count}, Modified: {result.modified_count}')
-    
-    client.close()
+from datetime import datetime, timezone
+from translation.translation import build_profile
+
+DEFAULT_USER_ID = '696c8e2f04fdddb47db2f16a'
+
+_client = None
+
+def get_client() -> AsyncIOMotorClient:
+    """Process-wide Motor client, created on first use so repeated updates reuse its pool"""
+    global _client
+    if _client is None:
+        _client = AsyncIOMotorClient('mongodb://localhost:27017', maxPoolSize=32)
+        atexit.register(_client.close)
+    return _client
+
+def load_user_data(user_id: str):
+    """A user's filtered data plus its translated profile, built in memory from the same parse"""
+    filtered_data = orjson.loads((Path('translation') / user_id / 'filtered.json').read_bytes())
+    return filtered_data, build_profile(filtered_data)
+
+async def update_mongo(user_ids: list[str]):
+    db = get_client().divergence
+
+    # Load and translate every user's filtered data concurrently, and fetch their usernames in one query
+    loaded = await asyncio.gather(*(asyncio.to_thread(load_user_data, user_id) for user_id in user_ids))
+    usernames = {
+        str(user['_id']): user['username']
+        async for user in db.users.find({'_id': {'$in': [ObjectId(user_id) for user_id in user_ids]}},
+                                        {'username': 1})
+    }
+
+    # Update MongoDB: one unordered bulk write for all users
+    processed_at = datetime.now(timezone.utc)
+    ops = []
+    for user_id, (filtered_data, translated_data) in zip(user_ids, loaded):
+        fields = {
+            'user_id': user_id,
+            'filtered_data': filtered_data,
+            'translated_data': translated_data,
+            'processed_at': processed_at
+        }
+        # Leave any stored username alone rather than overwriting it with None
+        if user_id in usernames:
+            fields['username'] = usernames[user_id]
+        else:
+            print(f'⚠ No users document for {user_id}, username left unchanged')
+        ops.append(UpdateOne({'user_id': user_id}, {'$set': fields}, upsert=True))
+    result = await db.github_data_collection.bulk_write(ops, ordered=False)
+
+    print(f'✓ Updated MongoDB with new filtered and translated data for {len(ops)} user(s)')
+    print(f'  Matched: {result.matched_count}, Modified: {result.modified_count}, Upserted: {result.upserted_count}')
 
 if __name__ == '__main__':
-    asyncio.run(update_mongo())
+    # python update_mongo.py [user_id ...]
+    asyncio.run(update_mongo(sys.argv[1:] or [DEFAULT_USER_ID]))